@@ -5,6 +5,7 @@ Provides caching for search results and query embeddings.
 
 import hashlib
 import json
+import re
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -14,6 +15,8 @@ from config import get_settings
 
 settings = get_settings()
 
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
 
 class CacheClient:
     """Redis cache client for Bible RAG."""
@@ -329,6 +332,121 @@ class CacheClient:
         except (redis.ConnectionError, redis.TimeoutError):
             return False
 
+    def generate_response_cache_key(
+        self,
+        query: str,
+        verses: list[dict],
+        language: str,
+    ) -> str:
+        """Generate a cache key for an AI response.
+
+        Args:
+            query: User's search query
+            verses: Verse result dictionaries the response is grounded on
+            language: Response language ('en' or 'ko')
+
+        Returns:
+            MD5 hash string for use as cache key
+        """
+        # Normalize inputs: lowercase, drop punctuation, collapse whitespace
+        query_normalized = " ".join(_PUNCTUATION_RE.sub("", query.lower()).split())
+        references = sorted(
+            f"{ref.get('book', '')}{ref.get('chapter', '')}:{ref.get('verse', '')}"
+            for ref in (v.get("reference", {}) for v in verses[:8])
+        )
+
+        # Create hash input
+        hash_input = f"{language}|{query_normalized}|{','.join(references)}"
+
+        # Generate MD5 hash
+        return hashlib.md5(hash_input.encode()).hexdigest()
+
+    def get_cached_response(self, cache_key: str) -> Optional[str]:
+        """Get a cached AI response.
+
+        Args:
+            cache_key: Cache key (MD5 hash)
+
+        Returns:
+            Cached response text or None if not found
+        """
+        try:
+            return self.client.get(f"response:{cache_key}")
+        except (redis.ConnectionError, redis.TimeoutError):
+            return None
+
+    def cache_response(
+        self,
+        cache_key: str,
+        response: str,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Cache an AI response.
+
+        Args:
+            cache_key: Cache key (MD5 hash)
+            response: Generated response text
+            ttl: Time-to-live in seconds. Uses settings default if not provided.
+
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        try:
+            self.client.setex(f"response:{cache_key}", ttl or settings.cache_ttl, response)
+            return True
+        except (redis.ConnectionError, redis.TimeoutError):
+            return False
+
+    def get_cached_metadata(self, key: str) -> Optional[str]:
+        """Get a cached metadata response body.
+
+        Args:
+            key: Metadata key, e.g. ``translations:en``
+
+        Returns:
+            Serialized JSON response or None if not found
+        """
+        try:
+            return self.client.get(f"meta:{key}")
+        except (redis.ConnectionError, redis.TimeoutError):
+            return None
+
+    def cache_metadata(
+        self,
+        key: str,
+        body: str,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Cache a metadata response body.
+
+        Args:
+            key: Metadata key, e.g. ``translations:en``
+            body: Serialized JSON response
+            ttl: Time-to-live in seconds. Uses settings default if not provided.
+
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        try:
+            self.client.setex(f"meta:{key}", ttl or settings.metadata_cache_ttl, body)
+            return True
+        except (redis.ConnectionError, redis.TimeoutError):
+            return False
+
+    def clear_metadata_cache(self) -> int:
+        """Clear cached translation and book listings.
+
+        Returns:
+            Number of keys deleted
+        """
+        try:
+            keys = self.client.keys("meta:*")
+            if keys:
+                return self.client.delete(*keys)
+            return 0
+        except (redis.ConnectionError, redis.TimeoutError):
+            return 0
+
 
 # Global cache client instance
 _cache_client: Optional[CacheClient] = None
@@ -32,6 +32,9 @@ class Settings(BaseSettings):
 
     # Cache
     cache_ttl: int = 86400  # 24 hours in seconds
+    metadata_cache_ttl: int = 604800  # Translation/book listings; cleared by ingestion
+    books_local_ttl: int = 300  # In-process copy of book listings per worker
+    health_stats_ttl: int = 30  # Row counts reported by /health
 
     # Search
     max_results_default: int = 10
@@ -44,20 +47,50 @@ class Settings(BaseSettings):
     enable_reranking: bool = True
     reranker_model: str = "BAAI/bge-reranker-v2-m3"
     rerank_top_n: int = 30  # Rerank top N candidates from RRF
+    reranker_always_score: bool = False  # Score even when every candidate already fits in top_k
+    reranker_warmup: bool = True  # Load and exercise the reranker at startup (disable for faster dev reloads)
+    reranker_char_cap: int = 800  # Truncate passages to this many characters before tokenizing
+    reranker_batch_size: int = 64  # (query, passage) pairs per cross-encoder forward pass
+    reranker_backend: str = "torch"  # "torch", "onnx" or "openvino" (onnx needs optimum[onnxruntime])
+    reranker_fp16: bool = True  # Half precision when the torch backend runs on CUDA
+    reranker_onnx_file: str = "onnx/model_qint8_avx512_vnni.onnx"  # Quantized weights tried first for onnx
+    reranker_export_dir: str = "~/.cache/bible-rag/reranker"  # Local exports reused by later workers
+    enable_rerank_batching: bool = True  # Coalesce concurrent searches into one cross-encoder call
+    rerank_batch_max: int = 8  # Maximum searches scored together
+    rerank_batch_wait_ms: int = 20  # Wait for other searches to join a rerank batch
+
+    # Original language data
+    strongs_cache_dir: str = "~/.cache/bible-rag"  # SQLite store of parsed Strong's entries, revalidated by ETag
+    strongs_cache_max_age: int = 86400  # Seconds a cached Strong's source is used without revalidating
 
     # Server
     debug: bool = False
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 1  # Uvicorn worker processes; model threads are split between them
 
     # Rate Limiting
     gemini_rpm: int = 10  # Requests per minute
     groq_rpm: int = 30
 
+    # LLM Timeouts
+    llm_timeout_s: float = 10.0  # Per-call timeout, just above typical p50 latency
+    race_providers: bool = False  # Query Groq and Gemini concurrently, keep the first to stream
+
+    # Gemini context caching of the system instruction
+    enable_prompt_caching: bool = False  # System instruction is below Gemini's cacheable minimum
+    prompt_cache_ttl_s: int = 3600
+
     # Batch Processing
     enable_batching: bool = False  # Disabled - use direct Groq calls for reliability
     batch_window_ms: int = 500  # Wait time to accumulate requests
     max_batch_size: int = 10  # Maximum requests per batch
+    max_queue_size: int = 1000  # Reject new requests beyond this many queued
+    max_queue_age_s: int = 120  # Fail queued requests that wait longer than this
+    enable_gemini_batch_api: bool = False  # Submit batches to Gemini's Batch API (50% cost, offline use only)
+    max_batch_wait_s: int = 60  # Fall back to parallel requests if the batch job takes longer
+    batch_poll_interval_s: float = 2.0  # Batch job status polling interval
+    marshal_group_size: int = 4  # Requests answered per prompt when not using the Batch API
 
 
 @lru_cache
@@ -13,7 +13,7 @@ from uuid import UUID
 
 import httpx
 from sqlalchemy import and_, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from database import Book, CrossReference, SessionLocal, Verse
 
@@ -371,8 +371,11 @@ class CrossReferenceManager:
         Returns:
             List of cross-reference dictionaries with verse details.
         """
+        # Load each related verse and its book in the same query instead of
+        # two lazy SELECTs per cross-reference
         query = (
             self.db.query(CrossReference)
+            .options(joinedload(CrossReference.related_verse).joinedload(Verse.book))
             .filter(CrossReference.verse_id == verse_id)
         )
 
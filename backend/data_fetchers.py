@@ -6,43 +6,32 @@ from public domain and free API sources.
 
 import re
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 from tqdm import tqdm
 
 from data.books_metadata import BOOKS_METADATA
 
+# Verse text cleanup patterns, compiled once for the per-verse loops
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_BOLLS_BREAK_TAG_RE = re.compile(r'<br\s*/?>|<p>|</p>|<i>|</i>|<b>|</b>')
+_WHITESPACE_RE = re.compile(r'\s+')
 
-def fetch_from_getbible(translation_code: str) -> list[dict]:
-    """Fetch Bible data from GetBible API.
 
-    Supports multiple translations including:
-    - kjv: King James Version (English)
-    - web: World English Bible (English)
-    - korean: Korean Revised Version (개역성경)
+def iter_getbible(translation_code: str) -> Iterator[list[dict]]:
+    """Stream Bible data from GetBible API one book at a time.
 
     Args:
         translation_code: Translation code (e.g., 'kjv', 'web', 'korean')
 
-    Returns:
-        List of verse dictionaries with keys:
-            - book_number: int (1-66)
-            - chapter: int
-            - verse: int
-            - text: str
+    Yields:
+        Verse dictionaries for each downloaded book (see fetch_from_getbible)
     """
     base_url = "https://api.getbible.net/v2"
-    verses_data = []
 
     print(f"Fetching {translation_code} from GetBible API...")
 
-    # Mapping of book names to book numbers
-    book_name_to_number = {}
-    for book_meta in BOOKS_METADATA:
-        book_name_to_number[book_meta.name.lower()] = book_meta.book_number
-        book_name_to_number[book_meta.abbreviation.lower()] = book_meta.book_number
-
     try:
         # Fetch books list
         books_url = f"{base_url}/{translation_code}/books.json"
@@ -50,60 +39,71 @@ def fetch_from_getbible(translation_code: str) -> list[dict]:
         response = requests.get(books_url, timeout=30)
         response.raise_for_status()
         books_data = response.json()
+    except requests.RequestException as e:
+        print(f"Error fetching books list: {e}")
+        return
 
-        # GetBible returns a dict with book numbers as keys
-        # Convert to list of book info dicts
-        if isinstance(books_data, dict):
-            books_list = list(books_data.values())
-        else:
-            books_list = books_data
+    # GetBible returns a dict with book numbers as keys
+    # Convert to list of book info dicts
+    if isinstance(books_data, dict):
+        books_list = list(books_data.values())
+    else:
+        books_list = books_data
 
-        # Iterate through each book
-        for book_info in tqdm(books_list, desc=f"Downloading {translation_code}"):
-            book_nr = book_info.get("nr")
-            book_name = book_info.get("name", "").lower()
+    # Iterate through each book
+    for book_info in tqdm(books_list, desc=f"Downloading {translation_code}"):
+        book_nr = book_info.get("nr")
+        book_number = book_nr
 
-            # Try to find book number from our metadata
-            book_number = book_nr
+        # Fetch all chapters for this book
+        book_url = f"{base_url}/{translation_code}/{book_nr}.json"
+        time.sleep(0.1)  # Rate limiting
 
-            # Fetch all chapters for this book
-            book_url = f"{base_url}/{translation_code}/{book_nr}.json"
-            time.sleep(0.1)  # Rate limiting
+        try:
+            book_response = requests.get(book_url, timeout=30)
+            book_response.raise_for_status()
+            book_json = book_response.json()
+        except requests.RequestException as e:
+            print(f"Error fetching book {book_nr}: {e}")
+            continue
 
-            try:
-                book_response = requests.get(book_url, timeout=30)
-                book_response.raise_for_status()
-                book_json = book_response.json()
+        book_verses = []
+        for chapter_data in book_json.get("chapters", []):
+            chapter_nr = chapter_data.get("chapter")
 
-                chapters = book_json.get("chapters", [])
+            for verse_data in chapter_data.get("verses", []):
+                # Clean HTML tags if present
+                text = _HTML_TAG_RE.sub('', verse_data.get("text", ""))
 
-                for chapter_data in chapters:
-                    chapter_nr = chapter_data.get("chapter")
-                    verses = chapter_data.get("verses", [])
+                book_verses.append({
+                    "book_number": book_number,
+                    "chapter": chapter_nr,
+                    "verse": verse_data.get("verse"),
+                    "text": text.strip(),
+                })
 
-                    for verse_data in verses:
-                        verse_nr = verse_data.get("verse")
-                        text = verse_data.get("text", "")
+        yield book_verses
 
-                        # Clean HTML tags if present
-                        import re
-                        text = re.sub(r'<[^>]+>', '', text)
 
-                        verses_data.append({
-                            "book_number": book_number,
-                            "chapter": chapter_nr,
-                            "verse": verse_nr,
-                            "text": text.strip(),
-                        })
+def fetch_from_getbible(translation_code: str) -> list[dict]:
+    """Fetch Bible data from GetBible API.
 
-            except requests.RequestException as e:
-                print(f"Error fetching book {book_nr}: {e}")
-                continue
+    Supports multiple translations including:
+    - kjv: King James Version (English)
+    - web: World English Bible (English)
+    - korean: Korean Revised Version (개역성경)
 
-    except requests.RequestException as e:
-        print(f"Error fetching books list: {e}")
-        return []
+    Args:
+        translation_code: Translation code (e.g., 'kjv', 'web', 'korean')
 
+    Returns:
+        List of verse dictionaries with keys:
+            - book_number: int (1-66)
+            - chapter: int
+            - verse: int
+            - text: str
+    """
+    verses_data = [verse for book in iter_getbible(translation_code) for verse in book]
     print(f"Fetched {len(verses_data)} verses from GetBible")
     return verses_data
 
@@ -155,28 +155,16 @@ def fetch_nkrv(sql_file_path: Optional[str] = None) -> list[dict]:
     return fetch_nkrv_impl(sql_file_path)
 
 
-def fetch_from_bolls(translation_code: str) -> list[dict]:
-    """Fetch Bible data from Bolls.life API (free, unlimited).
-
-    Supports 100+ translations including:
-    - NIV, NIV2011: New International Version
-    - ESV: English Standard Version
-    - NASB: New American Standard Bible
-    - KRV: 개역한글 (Korean Revised Version)
-    - RNKSV: 새번역 (New Korean Revised Standard Version)
+def iter_bolls(translation_code: str) -> Iterator[list[dict]]:
+    """Stream Bible data from Bolls.life API one chapter at a time.
 
     Args:
         translation_code: Translation code (e.g., 'NIV', 'ESV', 'NASB', 'KRV')
 
-    Returns:
-        List of verse dictionaries with keys:
-            - book_number: int (1-66)
-            - chapter: int
-            - verse: int
-            - text: str
+    Yields:
+        Verse dictionaries for each downloaded chapter (see fetch_from_bolls)
     """
     base_url = "https://bolls.life"
-    verses_data = []
 
     print(f"Fetching {translation_code} from Bolls.life API...")
 
@@ -202,87 +190,105 @@ def fetch_from_bolls(translation_code: str) -> list[dict]:
                 continue
             else:
                 print(f"❌ Failed to fetch books list after {max_retries} retries: {e}")
-                return []
+                return
 
     if books_data is None:
-        return []
+        return
+
+    # Iterate through each book
+    for book_info in tqdm(books_data, desc=f"Downloading {translation_code}"):
+        book_number = book_info.get("bookid")  # 1-66
+        book_name = book_info.get("name")
+        num_chapters = book_info.get("chapters")  # Number of chapters (int)
+
+        # Skip if no chapters
+        if not num_chapters:
+            continue
+
+        # Fetch each chapter (1 to num_chapters)
+        for chapter_nr in range(1, num_chapters + 1):
+            # Fetch verses for this chapter
+            verse_url = f"{base_url}/get-chapter/{translation_code}/{book_number}/{chapter_nr}/"
+            time.sleep(0.1)  # Rate limiting
 
-    try:
+            # Retry logic with exponential backoff
+            max_retries = 3
+            retry_delay = 1
+            verse_data = None
+
+            for attempt in range(max_retries):
+                try:
+                    verse_response = requests.get(verse_url, timeout=60)  # Increased timeout to 60s
+                    verse_response.raise_for_status()
+                    verse_data = verse_response.json()
+                    break  # Success, exit retry loop
+
+                except (requests.Timeout, requests.RequestException) as e:
+                    if attempt < max_retries - 1:
+                        print(f"\n  ⏳ Retry {attempt + 1}/{max_retries} for {book_name} {chapter_nr}")
+                        time.sleep(retry_delay)
+                        retry_delay *= 2  # Exponential backoff
+                        continue
+                    else:
+                        print(f"\n  ❌ Failed after {max_retries} retries: {book_name} {chapter_nr}: {e}")
+                        verse_data = None
+                        break
+
+            # Skip if we couldn't fetch the data
+            if verse_data is None:
+                continue
 
-        # Iterate through each book
-        for book_info in tqdm(books_data, desc=f"Downloading {translation_code}"):
-            book_number = book_info.get("bookid")  # 1-66
-            book_name = book_info.get("name")
-            num_chapters = book_info.get("chapters")  # Number of chapters (int)
+            # Parse verses
+            chapter_verses = []
+            for verse in verse_data:
+                text = verse.get("text", "")
 
-            # Skip if no chapters
-            if not num_chapters:
-                continue
+                # Clean HTML tags from Bolls.life text
+                # Remove <br/>, <br>, and other common HTML tags
+                text = _BOLLS_BREAK_TAG_RE.sub(' ', text)
+                text = _HTML_TAG_RE.sub('', text)  # Remove any remaining HTML tags
+                text = _WHITESPACE_RE.sub(' ', text)  # Normalize whitespace
 
-            # Fetch each chapter (1 to num_chapters)
-            for chapter_nr in range(1, num_chapters + 1):
-                # Fetch verses for this chapter
-                verse_url = f"{base_url}/get-chapter/{translation_code}/{book_number}/{chapter_nr}/"
-                time.sleep(0.1)  # Rate limiting
-
-                # Retry logic with exponential backoff
-                max_retries = 3
-                retry_delay = 1
-                verse_data = None
-
-                for attempt in range(max_retries):
-                    try:
-                        verse_response = requests.get(verse_url, timeout=60)  # Increased timeout to 60s
-                        verse_response.raise_for_status()
-                        verse_data = verse_response.json()
-                        break  # Success, exit retry loop
-
-                    except (requests.Timeout, requests.RequestException) as e:
-                        if attempt < max_retries - 1:
-                            print(f"\n  ⏳ Retry {attempt + 1}/{max_retries} for {book_name} {chapter_nr}")
-                            time.sleep(retry_delay)
-                            retry_delay *= 2  # Exponential backoff
-                            continue
-                        else:
-                            print(f"\n  ❌ Failed after {max_retries} retries: {book_name} {chapter_nr}: {e}")
-                            verse_data = None
-                            break
-
-                # Skip if we couldn't fetch the data
-                if verse_data is None:
-                    continue
-
-                # Parse verses
-                for verse in verse_data:
-                    verse_nr = verse.get("verse")
-                    text = verse.get("text", "")
-
-                    # Clean HTML tags from Bolls.life text
-                    # Remove <br/>, <br>, and other common HTML tags
-                    text = re.sub(r'<br\s*/?>|<p>|</p>|<i>|</i>|<b>|</b>', ' ', text)
-                    text = re.sub(r'<[^>]+>', '', text)  # Remove any remaining HTML tags
-                    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-
-                    verses_data.append({
-                        "book_number": book_number,
-                        "chapter": chapter_nr,
-                        "verse": verse_nr,
-                        "text": text.strip(),
-                    })
+                chapter_verses.append({
+                    "book_number": book_number,
+                    "chapter": chapter_nr,
+                    "verse": verse.get("verse"),
+                    "text": text.strip(),
+                })
 
-    except requests.RequestException as e:
-        print(f"Error fetching books list: {e}")
-        return []
+            yield chapter_verses
+
+
+def fetch_from_bolls(translation_code: str) -> list[dict]:
+    """Fetch Bible data from Bolls.life API (free, unlimited).
+
+    Supports 100+ translations including:
+    - NIV, NIV2011: New International Version
+    - ESV: English Standard Version
+    - NASB: New American Standard Bible
+    - KRV: 개역한글 (Korean Revised Version)
+    - RNKSV: 새번역 (New Korean Revised Standard Version)
+
+    Args:
+        translation_code: Translation code (e.g., 'NIV', 'ESV', 'NASB', 'KRV')
 
+    Returns:
+        List of verse dictionaries with keys:
+            - book_number: int (1-66)
+            - chapter: int
+            - verse: int
+            - text: str
+    """
+    verses_data = [verse for chapter in iter_bolls(translation_code) for verse in chapter]
     print(f"Fetched {len(verses_data)} verses from Bolls.life")
     return verses_data
 
 
-# Translation mappings for public domain sources (GetBible)
-GETBIBLE_FETCHERS = {
-    "KJV": fetch_kjv,
-    "WEB": fetch_web,
-    "RKV": fetch_korean,  # Korean Revised Version (개역성경)
+# Translation codes for public domain sources (GetBible)
+GETBIBLE_TRANSLATIONS = {
+    "KJV": "kjv",
+    "WEB": "web",
+    "RKV": "korean",  # Korean Revised Version (개역성경)
 }
 
 # Translation requiring manual SQL file (educational use only)
@@ -306,38 +312,54 @@ BOLLS_TRANSLATIONS = {
 }
 
 
-def fetch_translation(abbreviation: str) -> list[dict]:
-    """Fetch a Bible translation by abbreviation.
+def iter_translation(abbreviation: str) -> Iterator[list[dict]]:
+    """Stream a Bible translation by abbreviation as it downloads.
 
     Tries multiple sources in order:
-    1. GetBible API (public domain only: KJV, WEB, RKV)
-    2. Bolls.life API (free, 100+ translations including NIV, ESV, NASB, Korean)
-    3. Manual fetchers (NKRV - requires SQL file)
+    1. GetBible API (public domain only: KJV, WEB, RKV), one book at a time
+    2. Bolls.life API (free, 100+ translations including NIV, ESV, NASB, Korean),
+       one chapter at a time
+    3. Manual fetchers (NKRV - requires SQL file), all at once
 
     Args:
         abbreviation: Translation abbreviation (e.g., 'KJV', 'NIV', 'ESV', 'KRV', 'NKRV')
 
-    Returns:
-        List of verse dictionaries
+    Yields:
+        Lists of verse dictionaries
     """
     # Try GetBible first (public domain, reliable)
-    if abbreviation in GETBIBLE_FETCHERS:
+    if abbreviation in GETBIBLE_TRANSLATIONS:
         print(f"Using GetBible API for {abbreviation}")
-        return GETBIBLE_FETCHERS[abbreviation]()
+        yield from iter_getbible(GETBIBLE_TRANSLATIONS[abbreviation])
+        return
 
     # Try Bolls.life (free, supports 100+ translations)
     if abbreviation in BOLLS_TRANSLATIONS:
         print(f"Using Bolls.life API for {abbreviation}")
-        bolls_code = BOLLS_TRANSLATIONS[abbreviation]
-        return fetch_from_bolls(bolls_code)
+        yield from iter_bolls(BOLLS_TRANSLATIONS[abbreviation])
+        return
 
     # Try manual fetchers (requires downloaded files)
     if abbreviation in MANUAL_FETCHERS:
         print(f"Using manual fetcher for {abbreviation}")
         print("⚠️  Educational/non-commercial use only")
-        return MANUAL_FETCHERS[abbreviation]()
+        yield MANUAL_FETCHERS[abbreviation]()
+        return
 
     print(f"No fetcher available for {abbreviation}")
-    available = list(GETBIBLE_FETCHERS.keys()) + list(BOLLS_TRANSLATIONS.keys()) + list(MANUAL_FETCHERS.keys())
+    available = list(GETBIBLE_TRANSLATIONS.keys()) + list(BOLLS_TRANSLATIONS.keys()) + list(MANUAL_FETCHERS.keys())
     print(f"Available translations: {available}")
-    return []
+
+
+def fetch_translation(abbreviation: str) -> list[dict]:
+    """Fetch a Bible translation by abbreviation.
+
+    See iter_translation for the sources tried.
+
+    Args:
+        abbreviation: Translation abbreviation (e.g., 'KJV', 'NIV', 'ESV', 'KRV', 'NKRV')
+
+    Returns:
+        List of verse dictionaries
+    """
+    return [verse for chunk in iter_translation(abbreviation) for verse in chunk]
@@ -1,8 +1,9 @@
 """Database models and connection management for Bible RAG."""
 
+import io
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
@@ -19,7 +20,7 @@ from sqlalchemy import (
 )
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, sessionmaker
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 import os
@@ -65,10 +66,19 @@ def _get_sync_db_url():
         url = url.replace("+asyncpg", "")
     return url
 
+def _get_sync_engine_options():
+    url = _get_sync_db_url()
+    if url.startswith(("postgresql://", "postgresql+psycopg2://")):
+        # Send executemany INSERTs as multi-row VALUES pages and batch the
+        # remaining executemany statements instead of one round-trip per row
+        return {"executemany_mode": "values_plus_batch", "insertmanyvalues_page_size": 1000}
+    return {}
+
 _sync_engine = create_engine(
     _get_sync_db_url(),
     pool_pre_ping=True,
     echo=settings.debug,
+    **_get_sync_engine_options(),
 )
 SessionLocal = sessionmaker(bind=_sync_engine, expire_on_commit=False)
 
@@ -291,7 +301,7 @@ class OriginalWord(Base):
         CheckConstraint(
             "language IN ('greek', 'hebrew', 'aramaic')", name="check_language"
         ),
-        Index("idx_original_words_verse", "verse_id"),
+        Index("idx_original_words_verse_order", "verse_id", "word_order"),
         Index("idx_original_words_strongs", "strongs_number"),
         Index("idx_original_words_language", "language"),
     )
@@ -332,6 +342,45 @@ async def init_db():
     print("Database schema created successfully!")
 
 
+def _copy_field(value: Any) -> str:
+    """Format a value for PostgreSQL's text COPY format."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_rows(db: Session, copy_sql: str, rows: Iterable[tuple]) -> None:
+    """Bulk load rows with PostgreSQL ``COPY FROM STDIN`` in text format.
+
+    Rows are streamed in one protocol message instead of going through INSERT
+    parsing and planning. Python-side column defaults are not applied, so
+    callers supply IDs and timestamps themselves.
+
+    Args:
+        db: Synchronous (psycopg2) database session
+        copy_sql: ``COPY table (columns) FROM STDIN`` statement
+        rows: Field tuples in the statement's column order
+    """
+    buffer = io.StringIO()
+    for fields in rows:
+        buffer.write("\t".join(map(_copy_field, fields)))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    # The session's own connection keeps COPY inside the current transaction
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(copy_sql, buffer)
+    finally:
+        cursor.close()
+
+
 async def create_vector_index(db_session=None):
     """Create ivfflat index for vector similarity search.
 
@@ -7,12 +7,17 @@ This module provides a flexible embedding system that can use either:
 The mode is controlled by the EMBEDDING_MODE environment variable.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 from config import get_settings
 
 settings = get_settings()
 
+# Smallest norm divided by when normalizing API embeddings
+_NORM_EPS = 1e-12
+
 # Local model (lazy loaded only when needed)
 _local_model = None
 
@@ -33,6 +38,31 @@ def _get_local_model():
     return _local_model
 
 
+def _new_gemini_client(api_key: str):
+    """Build a Gemini client bound to one API key."""
+    from google.ai import generativelanguage as glm
+
+    return glm.GenerativeServiceClient(client_options={"api_key": api_key})
+
+
+@lru_cache(maxsize=1)
+def _get_server_gemini_client():
+    """Get the cached Gemini client for the server key."""
+    return _new_gemini_client(settings.gemini_api_key)
+
+
+def _get_gemini_client(api_key: str):
+    """Get a Gemini client bound to one API key.
+
+    ``genai.configure`` sets a process-wide key, so concurrent embeddings
+    (run in worker threads) could otherwise go out under another caller's key.
+    Only the server key's client is cached; user-supplied keys get a fresh one.
+    """
+    if api_key == settings.gemini_api_key:
+        return _get_server_gemini_client()
+    return _new_gemini_client(api_key)
+
+
 def embed_query_local(query: str) -> np.ndarray:
     """Generate embedding using local sentence-transformers model.
 
@@ -62,18 +92,22 @@ def embed_query_gemini(query: str, api_key: str) -> np.ndarray:
         api_key: User's Gemini API key
 
     Returns:
-        1024-dimensional embedding vector
+        1024-dimensional L2-normalized float32 embedding vector
     """
     import google.generativeai as genai
 
-    genai.configure(api_key=api_key)
     result = genai.embed_content(
         model="models/gemini-embedding-001",
         content=query,
         task_type="RETRIEVAL_QUERY",
         output_dimensionality=1024,
+        client=_get_gemini_client(api_key),
     )
-    return np.array(result["embedding"])
+    embedding = np.asarray(result["embedding"], dtype=np.float32)
+    # Match the local path's normalize_embeddings=True behavior
+    # Guard against a zero vector, which would otherwise become NaNs
+    embedding /= max(np.linalg.norm(embedding), _NORM_EPS)
+    return embedding
 
 
 def embed_query(query: str, api_key: str | None = None) -> np.ndarray:
@@ -119,8 +153,7 @@ def embed_texts(texts: list[str], api_key: str | None = None) -> np.ndarray:
             raise ValueError("Gemini API key required for embedding")
         import google.generativeai as genai
 
-        genai.configure(api_key=api_key)
-
+        client = _get_gemini_client(api_key)
         embeddings = []
         for text in texts:
             result = genai.embed_content(
@@ -128,9 +161,12 @@ def embed_texts(texts: list[str], api_key: str | None = None) -> np.ndarray:
                 content=text,
                 task_type="RETRIEVAL_DOCUMENT",
                 output_dimensionality=1024,
+                client=client,
             )
             embeddings.append(result["embedding"])
-        return np.array(embeddings)
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), _NORM_EPS)
+        return embeddings
     else:
         model = _get_local_model()
         prefixed = [f"passage: {t}" for t in texts]
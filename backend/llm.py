@@ -4,48 +4,223 @@ Supports Google Gemini (primary) and Groq (fallback) for generating
 AI-powered contextual responses based on search results.
 """
 
+import asyncio
+import json
 import logging
+import re
+import threading
 import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional
 
+import httpx
+
+# h2 is optional - without it the shared client falls back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import google.generativeai as genai
+    from google.ai import generativelanguage as glm
+except ImportError:
+    genai = None
+    glm = None
+
+try:
+    from groq import AsyncGroq
+except ImportError:
+    AsyncGroq = None
+
+from cache import get_cache
 from config import get_settings
+from rate_limit import check_rate_limit
 
 settings = get_settings()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Rate limiting state
-_rate_limit_state = {
-    "gemini": {"count": 0, "reset_time": 0},
-    "groq": {"count": 0, "reset_time": 0},
-}
+SYSTEM_INSTRUCTION = (
+    "You are a knowledgeable Bible study assistant. Provide thoughtful, contextual "
+    "answers that help users understand biblical teachings. Always cite specific verse "
+    "references and explain theological significance. Your responses should be "
+    "complete, ending with proper punctuation."
+)
 
 
-def _check_rate_limit(provider: str, limit: int) -> bool:
-    """Check if we're within rate limits for a provider.
+def _bind_gemini_clients(model, api_key: str):
+    """Attach clients built from ``api_key`` to a model before its first call.
 
-    Args:
-        provider: 'gemini' or 'groq'
-        limit: Requests per minute limit
+    ``genai.configure`` sets a single process-wide key, and a model binds
+    whichever key is configured when it makes its first call. Giving each
+    model its own clients keeps user and server traffic on the right key.
+    """
+    # GenerativeModel only creates its clients lazily from the global config;
+    # refuse to run on an SDK where that is no longer how it works
+    if not (hasattr(model, "_client") and hasattr(model, "_async_client")):
+        raise RuntimeError(
+            "Unsupported google-generativeai version: cannot bind per-key Gemini clients"
+        )
+    options = {"api_key": api_key}
+    model._client = glm.GenerativeServiceClient(client_options=options)
+    model._async_client = glm.GenerativeServiceAsyncClient(client_options=options)
+    return model
 
-    Returns:
-        True if within limits, False if rate limited
+
+def _new_gemini_model(api_key: str, model_name: str, system_instruction: str | None):
+    """Build a Gemini model bound to an API key."""
+    if genai is None:
+        raise RuntimeError("google-generativeai is not installed")
+
+    model = genai.GenerativeModel(model_name, system_instruction=system_instruction)
+    return _bind_gemini_clients(model, api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_server_gemini_model(
+    model_name: str = "gemini-1.5-flash",
+    system_instruction: str | None = SYSTEM_INSTRUCTION,
+):
+    """Get a Gemini model on the server key, cached per model.
+
+    Reusing the model keeps its underlying client (and connection) alive
+    across requests instead of re-running auth setup on every call.
+    """
+    return _new_gemini_model(settings.gemini_api_key, model_name, system_instruction)
+
+
+def _get_gemini_model(
+    api_key: str,
+    model_name: str = "gemini-1.5-flash",
+    system_instruction: str | None = SYSTEM_INSTRUCTION,
+):
+    """Get a Gemini model bound to an API key.
+
+    Only the server key's models are cached; user-supplied keys get a fresh
+    model that is released with the request.
+    """
+    if api_key == settings.gemini_api_key:
+        return _get_server_gemini_model(model_name, system_instruction)
+    return _new_gemini_model(api_key, model_name, system_instruction)
+
+
+# Gemini context caches for the server key's system instruction: model -> (model, expires_at)
+_context_cache_models: dict[str, tuple[object, float]] = {}
+_context_cache_lock = threading.Lock()
+_CONTEXT_CACHE_MAX_MODELS = 8
+# Gemini rejects cached content below this many tokens
+_CONTEXT_CACHE_MIN_TOKENS = 1024
+
+
+def _create_cached_content(api_key: str, model_name: str):
+    """Create the system instruction's cached content (blocking REST call)."""
+    with _context_cache_lock:
+        # CachedContent.create reads genai's process-wide configuration
+        genai.configure(api_key=api_key)
+        return genai.caching.CachedContent.create(
+            model=model_name,
+            system_instruction=SYSTEM_INSTRUCTION,
+            ttl=timedelta(seconds=settings.prompt_cache_ttl_s),
+        )
+
+
+async def _get_context_cached_gemini_model(model_name: str = "gemini-1.5-flash"):
+    """Get a server-key Gemini model whose system instruction is served from a context cache.
+
+    The cached content is recreated shortly before its TTL runs out. If the
+    instruction is below the minimum cacheable size, or creating the cache
+    fails, the plain model is used instead.
+    """
+    api_key = settings.gemini_api_key
+    # Rough estimate of ~4 characters per token
+    if len(SYSTEM_INSTRUCTION) // 4 < _CONTEXT_CACHE_MIN_TOKENS:
+        return _get_gemini_model(api_key, model_name)
+
+    current_time = time.monotonic()
+    with _context_cache_lock:
+        entry = _context_cache_models.get(model_name)
+        if entry is not None and entry[1] > current_time:
+            return entry[0]
+
+    try:
+        cached_content = await asyncio.to_thread(_create_cached_content, api_key, model_name)
+        model = _bind_gemini_clients(
+            genai.GenerativeModel.from_cached_content(cached_content=cached_content), api_key
+        )
+        logger.info("Created Gemini context cache %s for %s", cached_content.name, model_name)
+    except Exception as e:
+        logger.info("Gemini context caching unavailable for %s: %s", model_name, e)
+        model = _get_gemini_model(api_key, model_name)
+
+    # Refresh 5 minutes before the cache expires
+    expires_at = current_time + max(settings.prompt_cache_ttl_s - 300, 60)
+    with _context_cache_lock:
+        _context_cache_models[model_name] = (model, expires_at)
+        # Bound the map; the oldest insertion is evicted first
+        while len(_context_cache_models) > _CONTEXT_CACHE_MAX_MODELS:
+            del _context_cache_models[next(iter(_context_cache_models))]
+    return model
+
+
+async def _get_system_gemini_model(api_key: str, model_name: str = "gemini-1.5-flash"):
+    """Get a Gemini model carrying the system instruction.
+
+    Only the server key's model is context-cached; user-supplied keys get a
+    plain model bound to their own key.
     """
-    current_time = time.time()
-    state = _rate_limit_state[provider]
+    if settings.enable_prompt_caching and api_key == settings.gemini_api_key:
+        return await _get_context_cached_gemini_model(model_name)
+    return _get_gemini_model(api_key, model_name)
 
-    # Reset counter if minute has passed
-    if current_time - state["reset_time"] >= 60:
-        state["count"] = 0
-        state["reset_time"] = current_time
 
-    if state["count"] >= limit:
-        logger.warning(f"{provider.capitalize()} rate limit exceeded ({limit} RPM)")
-        return False
+# Shared HTTP client for LLM provider REST calls
+_http_client: Optional[httpx.AsyncClient] = None
 
-    state["count"] += 1
-    return True
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP/2 client for LLM provider calls.
+
+    One pool of keep-alive connections is reused by every request, so TLS
+    handshakes are amortized and concurrent calls multiplex over HTTP/2.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=3.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=85,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _http_client
+    # Cached Groq clients hold a reference to the closed pool
+    _get_groq_client.cache_clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@lru_cache(maxsize=4)
+def _get_groq_client(api_key: str):
+    """Get an async Groq client, cached per API key.
+
+    The client shares the module's HTTP/2 connection pool across requests.
+    """
+    if AsyncGroq is None:
+        raise RuntimeError("groq is not installed")
+
+    return AsyncGroq(api_key=api_key, http_client=get_http_client())
 
 
 async def expand_query(
@@ -68,8 +243,6 @@ async def expand_query(
     Returns:
         List of 3 alternative search queries, or empty list on failure.
     """
-    import json as _json
-
     prompt = (
         "Generate exactly 3 short search queries (3-8 words each) that capture "
         "different aspects of this Bible study question. Focus on biblical concepts, "
@@ -81,50 +254,47 @@ async def expand_query(
 
     # Try Groq first (faster)
     groq_key = groq_api_key or settings.groq_api_key
-    if groq_key and _check_rate_limit("groq", settings.groq_rpm):
+    if groq_key and check_rate_limit("groq", settings.groq_rpm):
         try:
-            from groq import AsyncGroq
-
-            client = AsyncGroq(api_key=groq_key)
+            client = _get_groq_client(groq_key)
             response = await client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=200,
                 temperature=0.3,
+                timeout=settings.llm_timeout_s,
             )
             text = response.choices[0].message.content.strip()
             # Parse JSON array from response
-            parsed = _json.loads(text)
+            parsed = json.loads(text)
             if isinstance(parsed, list) and all(isinstance(q, str) for q in parsed):
-                logger.info(f"Query expansion (Groq): {query!r} → {parsed}")
+                logger.info("Query expansion (Groq): %r → %s", query, parsed)
                 return parsed[:3]
         except Exception as e:
-            logger.warning(f"Groq query expansion failed: {e}")
+            logger.warning("Groq query expansion failed: %s", e)
 
     # Fallback to Gemini
     gemini_key = gemini_api_key or settings.gemini_api_key
-    if gemini_key and _check_rate_limit("gemini", settings.gemini_rpm):
+    if gemini_key and check_rate_limit("gemini", settings.gemini_rpm):
         try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=gemini_key)
-            model = genai.GenerativeModel("gemini-1.5-flash")
+            model = _get_gemini_model(gemini_key, system_instruction=None)
             response = await model.generate_content_async(
                 prompt,
                 generation_config=genai.GenerationConfig(
                     max_output_tokens=200,
                     temperature=0.3,
                 ),
+                request_options={"timeout": settings.llm_timeout_s},
             )
             text = response.text.strip()
-            parsed = _json.loads(text)
+            parsed = json.loads(text)
             if isinstance(parsed, list) and all(isinstance(q, str) for q in parsed):
-                logger.info(f"Query expansion (Gemini): {query!r} → {parsed}")
+                logger.info("Query expansion (Gemini): %r → %s", query, parsed)
                 return parsed[:3]
         except Exception as e:
-            logger.warning(f"Gemini query expansion failed: {e}")
+            logger.warning("Gemini query expansion failed: %s", e)
 
-    logger.info(f"Query expansion skipped for: {query!r}")
+    logger.info("Query expansion skipped for: %r", query)
     return []
 
 
@@ -157,44 +327,8 @@ def _format_conversation_history(
         return f"\nPrevious conversation:\n{history_text}\n"
 
 
-def _build_prompt(
-    query: str,
-    verses: list[dict],
-    language: str = "en",
-    conversation_history: list[dict] | None = None,
-) -> str:
-    """Build the prompt for LLM response generation.
-
-    Args:
-        query: User's search query
-        verses: List of verse result dictionaries
-        language: Response language ('en' or 'ko')
-        conversation_history: Previous conversation turns for context
-
-    Returns:
-        Formatted prompt string
-    """
-    # Format verses for context (use top 8 for better context)
-    verse_context = []
-    for i, v in enumerate(verses[:8], 1):
-        ref = v.get("reference", {})
-        translations = v.get("translations", {})
-
-        # Get first available translation text
-        text = next(iter(translations.values()), "")
-        # Truncate very long verses for token efficiency
-        text_preview = text[:150] + "..." if len(text) > 150 else text
-
-        verse_context.append(
-            f"{i}. {ref.get('book', '')} {ref.get('chapter', '')}:{ref.get('verse', '')} - \"{text_preview}\""
-        )
-
-    verses_text = "\n".join(verse_context)
-    verse_count = len(verses[:8])
-    history_section = _format_conversation_history(conversation_history, language)
-
-    if language == "ko":
-        prompt = f"""다음 성경 구절들을 바탕으로 질문에 대해 포괄적인 답변을 제공해 주세요.
+# Prompt templates, filled by _build_prompt
+_PROMPT_KO = """다음 성경 구절들을 바탕으로 질문에 대해 포괄적인 답변을 제공해 주세요.
 {history_section}
 질문: {query}
 
@@ -208,8 +342,8 @@ def _build_prompt(
 - 실제 적용이나 핵심 교훈으로 마무리해 주세요
 - 답변이 완전한 문장으로 끝나도록 해 주세요
 - 이전 대화가 있다면 맥락을 고려하여 답변해 주세요"""
-    else:
-        prompt = f"""Based on the following Bible verses, please provide a comprehensive answer to the question.
+
+_PROMPT_EN = """Based on the following Bible verses, please provide a comprehensive answer to the question.
 {history_section}
 Question: {query}
 
@@ -224,7 +358,49 @@ Instructions:
 - Ensure your response is complete and ends with proper punctuation
 - If there is previous conversation context, take it into account in your response"""
 
-    return prompt
+
+def _build_prompt(
+    query: str,
+    verses: list[dict],
+    language: str = "en",
+    conversation_history: list[dict] | None = None,
+) -> str:
+    """Build the prompt for LLM response generation.
+
+    Args:
+        query: User's search query
+        verses: List of verse result dictionaries
+        language: Response language ('en' or 'ko')
+        conversation_history: Previous conversation turns for context
+
+    Returns:
+        Formatted prompt string
+    """
+    # Format verses for context (use top 8 for better context)
+    # Use the first available translation text, truncated for token
+    # efficiency (probing text[150:151] avoids measuring the whole string)
+    top_verses = verses[:8]
+    verses_text = "\n".join(
+        f'{i}. {ref.get("book", "")} {ref.get("chapter", "")}:{ref.get("verse", "")} - '
+        f'"{text[:150] + "..." if text[150:151] else text}"'
+        for i, (ref, text) in enumerate(
+            (
+                (v.get("reference", {}), next(iter(v.get("translations", {}).values()), ""))
+                for v in top_verses
+            ),
+            1,
+        )
+    )
+    verse_count = len(top_verses)
+    history_section = _format_conversation_history(conversation_history, language)
+
+    template = _PROMPT_KO if language == "ko" else _PROMPT_EN
+    return template.format(
+        history_section=history_section,
+        query=query,
+        verse_count=verse_count,
+        verses_text=verses_text,
+    )
 
 
 async def generate_response_stream_gemini(
@@ -236,18 +412,12 @@ async def generate_response_stream_gemini(
 ) -> any:  # Returns an async generator
     """Generate a streaming response using Google Gemini."""
     gemini_key = api_key or settings.gemini_api_key
-    if not gemini_key or not _check_rate_limit("gemini", settings.gemini_rpm):
+    if not gemini_key or not check_rate_limit("gemini", settings.gemini_rpm):
         yield None
         return
 
     try:
-        import google.generativeai as genai
-
-        genai.configure(api_key=gemini_key)
-        model = genai.GenerativeModel(
-            "gemini-1.5-flash", # Use 1.5-flash for speed
-            system_instruction="You are a knowledgeable Bible study assistant. Provide thoughtful, contextual answers that help users understand biblical teachings. Always cite specific verse references and explain theological significance. Your responses should be complete, ending with proper punctuation."
-        )
+        model = await _get_system_gemini_model(gemini_key)
 
         prompt = _build_prompt(query, verses, language, conversation_history)
         
@@ -257,21 +427,30 @@ async def generate_response_stream_gemini(
         # To stream asynchronously, we might need to wrap it or use their async client if available.
         # As of recent versions, genai.generate_content_async is available.
         
-        response = await model.generate_content_async(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                max_output_tokens=1024,
-                temperature=0.7,
+        # Bound the wait for the stream to start without cutting off a long answer
+        response = await asyncio.wait_for(
+            model.generate_content_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    max_output_tokens=1024,
+                    temperature=0.7,
+                ),
+                stream=True
             ),
-            stream=True
+            timeout=settings.llm_timeout_s,
         )
         
         async for chunk in response:
-            if chunk.text:
-                yield chunk.text
+            # chunk.text raises on chunks without text parts (e.g. the final
+            # chunk carrying only finish metadata), so read the parts directly
+            text = "".join(
+                part.text for candidate in chunk.candidates for part in candidate.content.parts
+            )
+            if text:
+                yield text
 
     except Exception as e:
-        logger.error(f"Gemini Streaming error: {e}")
+        logger.error("Gemini Streaming error: %s", e)
         yield None
 
 
@@ -284,21 +463,19 @@ async def generate_response_stream_groq(
 ) -> any:  # Returns an async generator
     """Generate a streaming response using Groq."""
     groq_key = api_key or settings.groq_api_key
-    if not groq_key or not _check_rate_limit("groq", settings.groq_rpm):
+    if not groq_key or not check_rate_limit("groq", settings.groq_rpm):
         yield None
         return
 
     try:
-        from groq import AsyncGroq
-
-        client = AsyncGroq(api_key=groq_key)
+        client = _get_groq_client(groq_key)
         prompt = _build_prompt(query, verses, language, conversation_history)
 
         # Build messages array with conversation history for Groq's chat format
         messages = [
             {
                 "role": "system",
-                "content": "You are a knowledgeable Bible study assistant. Provide thoughtful, contextual answers that help users understand biblical teachings. Always cite specific verse references and explain theological significance. Your responses should be complete, ending with proper punctuation.",
+                "content": SYSTEM_INSTRUCTION,
             },
         ]
         # Inject conversation history as prior messages
@@ -316,6 +493,7 @@ async def generate_response_stream_groq(
             max_tokens=1024,
             temperature=0.7,
             stream=True,
+            timeout=settings.llm_timeout_s,
         )
 
         async for chunk in stream:
@@ -324,7 +502,7 @@ async def generate_response_stream_groq(
                 yield content
 
     except Exception as e:
-        logger.error(f"Groq Streaming error: {e}")
+        logger.error("Groq Streaming error: %s", e)
         yield None
 
 
@@ -336,39 +514,93 @@ async def generate_contextual_response_stream(
     groq_api_key: str | None = None,
     conversation_history: list[dict] | None = None,
 ):
-    """Generate a streaming contextual response."""
+    """Generate a streaming contextual response.
+
+    Responses without conversation history are cached by normalized query,
+    verse references and language, so repeated questions skip the LLM call.
+    """
     if not verses:
         yield None
         return
 
-    # Try Groq first
-    try:
-        groq_gen = generate_response_stream_groq(query, verses, language, api_key=groq_api_key, conversation_history=conversation_history)
-        
-        # Check if we get any content effectively
-        # Since it is a generator, we iterate. Use a flag.
-        first_chunk = True
-        async for chunk in groq_gen:
-            if chunk is None:
-                break # Failed
-            yield chunk
-            first_chunk = False
-        
-        if not first_chunk:
+    cache = get_cache()
+    cache_key = None
+    if not conversation_history:
+        cache_key = cache.generate_response_cache_key(query, verses, language)
+        cached = cache.get_cached_response(cache_key)
+        if cached:
+            yield cached
+            return
+
+    groq_stream = generate_response_stream_groq(query, verses, language, api_key=groq_api_key, conversation_history=conversation_history)
+    gemini_stream = generate_response_stream_gemini(query, verses, language, api_key=gemini_api_key, conversation_history=conversation_history)
+
+    if settings.race_providers:
+        # Run both providers and keep whichever starts streaming first
+        sources = [("Provider race", _race_streams([groq_stream, gemini_stream]))]
+    else:
+        # Try Groq first, then fall back to Gemini
+        sources = [("Groq", groq_stream), ("Gemini", gemini_stream)]
+
+    for name, stream in sources:
+        chunks = []
+        try:
+            # A None chunk signals the provider failed
+            async for chunk in stream:
+                if chunk is None:
+                    break
+                chunks.append(chunk)
+                yield chunk
+            else:
+                if chunks and cache_key:
+                    cache.cache_response(cache_key, "".join(chunks))
+        except Exception as e:
+            logger.error("%s stream failed: %s", name, e)
+
+        if chunks:
             return  # Success
 
-    except Exception as e:
-        logger.error(f"Groq stream failed: {e}")
 
-    # Fallback to Gemini
+async def _next_chunk(stream):
+    """Await the next chunk of a provider stream (None when exhausted)."""
+    return await anext(stream, None)
+
+
+async def _race_streams(streams: list):
+    """Yield from whichever provider stream produces content first.
+
+    The losing streams are cancelled and closed as soon as a winner yields
+    its first chunk. Yields None if every stream fails.
+    """
+    pending = {asyncio.create_task(_next_chunk(stream)): stream for stream in streams}
+    winner = None
+    first_chunk = None
+
     try:
-        gemini_gen = generate_response_stream_gemini(query, verses, language, api_key=gemini_api_key, conversation_history=conversation_history)
-        async for chunk in gemini_gen:
-            if chunk is None:
-                break
-            yield chunk
-    except Exception as e:
-        logger.error(f"Gemini stream failed: {e}")
+        while pending and winner is None:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                stream = pending.pop(task)
+                chunk = None if task.exception() else task.result()
+                if winner is None and chunk is not None:
+                    winner, first_chunk = stream, chunk
+                else:
+                    await stream.aclose()
+    finally:
+        # Cancel the losers before closing their generators
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for stream in pending.values():
+            await stream.aclose()
+
+    if winner is None:
+        yield None
+        return
+
+    yield first_chunk
+    async for chunk in winner:
+        yield chunk
 
 
 def generate_contextual_response(
@@ -389,10 +621,18 @@ def generate_contextual_response(
     # Return None is safest for "fallback" behavior if tests expect Optional[str].
     return None
 
+
+# Korean syllables and compatibility jamo; letters of any script
+_KOREAN_RE = re.compile(r"[\uac00-\ud7a3\u3131-\u3163]")
+_ALPHA_RE = re.compile(r"[^\W\d_]")
+
+
+@lru_cache(maxsize=2048)
 def detect_language(text: str) -> str:
     """Detect the language of input text.
 
-    Simple heuristic based on character ranges.
+    Simple heuristic based on character ranges. Results are memoized since
+    the same query is detected several times per search.
 
     Args:
         text: Input text to analyze
@@ -400,19 +640,14 @@ def detect_language(text: str) -> str:
     Returns:
         'ko' for Korean, 'en' for English/other
     """
-    korean_chars = 0
-    total_chars = 0
-
-    for char in text:
-        if char.isalpha():
-            total_chars += 1
-            # Korean Unicode range
-            if "\uac00" <= char <= "\ud7a3" or "\u3131" <= char <= "\u3163":
-                korean_chars += 1
+    # Count with C-level regex scans instead of a per-character Python loop
+    total_chars = len(_ALPHA_RE.findall(text))
 
     if total_chars == 0:
         return "en"
 
+    korean_chars = len(_KOREAN_RE.findall(text))
+
     # If more than 30% Korean characters, consider it Korean
     if korean_chars / total_chars > 0.3:
         return "ko"
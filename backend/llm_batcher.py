@@ -5,17 +5,56 @@ Gemini's Batch API (50% cost savings) and higher rate limits.
 """
 
 import asyncio
+import json
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 from uuid import UUID, uuid4
 
+import httpx
+
+try:
+    from google.api_core.exceptions import DeadlineExceeded
+    # Raised by the SDK call's own timeout; asyncio.TimeoutError by the backstop
+    TIMEOUT_ERRORS = (asyncio.TimeoutError, DeadlineExceeded)
+except ImportError:
+    TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+
+from cache import get_cache
 from config import get_settings
+from llm import (
+    SYSTEM_INSTRUCTION,
+    _build_prompt,
+    _get_system_gemini_model,
+    generate_contextual_response,
+    generate_response_stream_groq,
+    get_http_client,
+)
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+BATCH_MODEL = "gemini-2.5-flash"
+
+# Extra time the asyncio backstop allows beyond the SDK's own request timeout
+TIMEOUT_GRACE_S = 2.0
+
+# Structured output for marshaled multi-question prompts
+MARSHALED_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "id": {"type": "INTEGER"},
+            "answer": {"type": "STRING"},
+        },
+        "required": ["id", "answer"],
+    },
+}
+
 
 @dataclass
 class BatchRequest:
@@ -41,9 +80,11 @@ class LLMBatcher:
     """Batches LLM requests for efficient API usage."""
 
     def __init__(self):
-        self.queue: list[BatchRequest] = []
+        self.queue: deque[BatchRequest] = deque()
         self.lock = asyncio.Lock()
         self.processing = False
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._new_request = asyncio.Event()
         self._background_task: Optional[asyncio.Task] = None
 
     async def start(self):
@@ -82,14 +123,85 @@ class LLMBatcher:
         """
         if not settings.enable_batching:
             # Fall back to direct processing
-            from llm import generate_contextual_response
-
             return generate_contextual_response(
                 query, verses, language,
                 gemini_api_key=gemini_api_key,
                 groq_api_key=groq_api_key,
             )
 
+        # Serve repeated questions from the response cache without queueing
+        cache = get_cache()
+        cache_key = cache.generate_response_cache_key(query, verses, language)
+        cached = cache.get_cached_response(cache_key)
+        if cached:
+            return cached
+
+        # Requests on a user's own API key are never shared with other callers
+        if gemini_api_key or groq_api_key:
+            result = await self._enqueue_and_wait(
+                query, verses, language,
+                gemini_api_key=gemini_api_key,
+                groq_api_key=groq_api_key,
+            )
+            if result:
+                cache.cache_response(cache_key, result)
+            return result
+
+        # Coalesce identical in-flight requests onto a single LLM call
+        async with self.lock:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[cache_key] = future
+
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+            # The leading request was cancelled; make the call ourselves
+            return await self._enqueue_and_wait(
+                query, verses, language,
+                gemini_api_key=gemini_api_key,
+                groq_api_key=groq_api_key,
+            )
+
+        try:
+            result = await self._enqueue_and_wait(
+                query, verses, language,
+                gemini_api_key=gemini_api_key,
+                groq_api_key=groq_api_key,
+            )
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            # Release waiting duplicates even if this request was cancelled
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                # Mark the exception as retrieved when no duplicate was waiting
+                future.exception()
+            async with self.lock:
+                del self._inflight[cache_key]
+
+        if result:
+            cache.cache_response(cache_key, result)
+
+        return result
+
+    async def _enqueue_and_wait(
+        self,
+        query: str,
+        verses: list[dict],
+        language: str,
+        gemini_api_key: str | None = None,
+        groq_api_key: str | None = None,
+    ) -> Optional[str]:
+        """Queue a request for the next batch and wait for its result."""
         # Create request
         request = BatchRequest(
             id=uuid4(),
@@ -101,17 +213,19 @@ class LLMBatcher:
             groq_api_key=groq_api_key,
         )
 
-        # Add to queue
+        # Add to queue and wake the batch processor
         async with self.lock:
+            if len(self.queue) >= settings.max_queue_size:
+                logger.warning("Batch queue full (%d), rejecting request", settings.max_queue_size)
+                return None
             self.queue.append(request)
+            self._new_request.set()
 
         # Wait for processing
         await request.completed.wait()
 
         if request.error:
             # Fall back to direct processing on error
-            from llm import generate_contextual_response
-
             return generate_contextual_response(
                 query, verses, language,
                 gemini_api_key=gemini_api_key,
@@ -121,20 +235,27 @@ class LLMBatcher:
         return request.result
 
     async def _process_batches(self):
-        """Background task that processes batches at regular intervals."""
+        """Background task that processes batches as requests arrive."""
         while True:
             try:
-                # Wait for the batch window
+                # Sleep until a request is queued, then give peers the
+                # batch window to join it
+                await self._new_request.wait()
                 await asyncio.sleep(settings.batch_window_ms / 1000.0)
 
                 # Get pending requests
                 async with self.lock:
-                    if not self.queue:
-                        continue
+                    self._evict_stale_requests()
 
                     # Take up to max_batch_size requests
-                    batch = self.queue[: settings.max_batch_size]
-                    self.queue = self.queue[settings.max_batch_size :]
+                    batch = [
+                        self.queue.popleft()
+                        for _ in range(min(len(self.queue), settings.max_batch_size))
+                    ]
+
+                    # Stay awake while requests are left over
+                    if not self.queue:
+                        self._new_request.clear()
 
                 if batch:
                     await self._process_batch(batch)
@@ -142,50 +263,205 @@ class LLMBatcher:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                print(f"Error in batch processor: {e}")
+                logger.error("Error in batch processor: %s", e)
+
+    def _evict_stale_requests(self) -> None:
+        """Fail queued requests that have waited longer than max_queue_age_s.
+
+        Must be called with ``self.lock`` held.
+        """
+        cutoff = time.time() - settings.max_queue_age_s
+        while self.queue and self.queue[0].timestamp < cutoff:
+            request = self.queue.popleft()
+            request.error = "queue timeout"
+            request.completed.set()
 
     async def _process_batch(self, batch: list[BatchRequest]):
         """Process a batch of requests using Gemini Batch API.
 
+        Falls back to parallel individual requests when the batch job fails
+        or does not finish within ``max_batch_wait_s``.
+
         Args:
             batch: List of BatchRequest objects to process
         """
         try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=settings.gemini_api_key)
-
             # Build batch requests
-            from llm import _build_prompt
-
             batch_contents = []
             for req in batch:
                 prompt = _build_prompt(req.query, req.verses, req.language)
                 batch_contents.append({"contents": [{"parts": [{"text": prompt}]}]})
 
-            # Make batch API call
-            model = genai.GenerativeModel(
-                "gemini-2.5-flash",  # Using stable model instead of preview
-                system_instruction="You are a knowledgeable Bible study assistant. Provide thoughtful, contextual answers that help users understand biblical teachings. Always cite specific verse references and explain theological significance. Your responses should be complete, ending with proper punctuation."
-            )
-
-            # Process requests individually but with better rate limiting
-            # Note: Google's batch API is async/file-based, so for real-time
-            # we'll process in parallel instead
+            if settings.enable_gemini_batch_api:
+                try:
+                    results = await self._run_batch_job(batch_contents)
+                except Exception as e:
+                    logger.warning("Gemini batch job failed, processing requests individually: %s", e)
+                else:
+                    for req, result in zip(batch, results):
+                        if result is None:
+                            req.error = "Missing response in batch job output"
+                        else:
+                            req.result = result
+                        req.completed.set()
+                    return
+
+            model = await _get_system_gemini_model(settings.gemini_api_key, BATCH_MODEL)
+
+            # Marshal requests into groups sharing one prompt, processed in parallel
+            group_size = max(1, settings.marshal_group_size)
             tasks = []
-            for req, content in zip(batch, batch_contents):
-                tasks.append(self._process_single(model, req, content["contents"][0]))
+            for start in range(0, len(batch), group_size):
+                group = batch[start : start + group_size]
+                if len(group) == 1:
+                    tasks.append(
+                        self._process_single(model, group[0], batch_contents[start]["contents"][0])
+                    )
+                else:
+                    tasks.append(self._process_group(model, group))
 
             # Wait for all to complete
             await asyncio.gather(*tasks, return_exceptions=True)
 
         except Exception as e:
-            print(f"Batch processing error: {e}")
+            logger.error("Batch processing error: %s", e)
             # Mark all as failed
             for req in batch:
                 req.error = str(e)
                 req.completed.set()
 
+    async def _run_batch_job(self, batch_contents: list[dict]) -> list[Optional[str]]:
+        """Run an inline Gemini Batch API job and wait for its results.
+
+        Args:
+            batch_contents: Request bodies, one per batched request
+
+        Returns:
+            Response text per request, in submission order (None if missing)
+
+        Raises:
+            httpx.HTTPError: If the Batch API rejects a call
+            RuntimeError: If the job ends in a non-successful state
+            asyncio.TimeoutError: If the job exceeds ``max_batch_wait_s``
+        """
+        body = {
+            "batch": {
+                "display_name": f"bible-rag-{uuid4()}",
+                "input_config": {
+                    "requests": {
+                        "requests": [
+                            {
+                                "request": {
+                                    **content,
+                                    "system_instruction": {"parts": [{"text": SYSTEM_INSTRUCTION}]},
+                                    "generation_config": {
+                                        "max_output_tokens": 1024,
+                                        "temperature": 0.7,
+                                    },
+                                },
+                                "metadata": {"key": str(i)},
+                            }
+                            for i, content in enumerate(batch_contents)
+                        ]
+                    }
+                },
+            }
+        }
+
+        client = get_http_client()
+        headers = {"x-goog-api-key": settings.gemini_api_key}
+
+        response = await client.post(
+            f"{GEMINI_API_BASE}/models/{BATCH_MODEL}:batchGenerateContent",
+            json=body,
+            headers=headers,
+        )
+        response.raise_for_status()
+        name = response.json()["name"]
+
+        deadline = time.monotonic() + settings.max_batch_wait_s
+        while True:
+            await asyncio.sleep(settings.batch_poll_interval_s)
+            response = await client.get(f"{GEMINI_API_BASE}/{name}", headers=headers)
+            response.raise_for_status()
+            job = response.json()
+
+            state = job.get("metadata", {}).get("state", "")
+            if state.endswith("_SUCCEEDED"):
+                break
+            if state.endswith(("_FAILED", "_CANCELLED", "_EXPIRED")):
+                raise RuntimeError(f"Batch job {name} ended in state {state}")
+            if time.monotonic() >= deadline:
+                try:
+                    await client.post(f"{GEMINI_API_BASE}/{name}:cancel", headers=headers)
+                except httpx.HTTPError:
+                    pass
+                raise asyncio.TimeoutError(
+                    f"Batch job {name} exceeded {settings.max_batch_wait_s}s"
+                )
+
+        results: list[Optional[str]] = [None] * len(batch_contents)
+        inlined = job.get("response", {}).get("inlinedResponses", {}).get("inlinedResponses", [])
+        for position, item in enumerate(inlined):
+            index = int(item.get("metadata", {}).get("key", position))
+            candidates = item.get("response", {}).get("candidates", [])
+            if candidates:
+                parts = candidates[0].get("content", {}).get("parts", [])
+                results[index] = "".join(part.get("text", "") for part in parts) or None
+
+        logger.info(
+            "Batch job %s: %d/%d responses",
+            name, sum(r is not None for r in results), len(results),
+        )
+        return results
+
+    async def _process_group(self, model, group: list[BatchRequest]) -> None:
+        """Answer several requests with a single marshaled prompt.
+
+        Args:
+            model: Gemini model instance
+            group: BatchRequest objects sharing the call
+        """
+        try:
+            start_time = time.time()
+            # Output grows with the group, so scale the timeout with it
+            timeout = settings.llm_timeout_s * len(group)
+            response = await asyncio.wait_for(
+                asyncio.to_thread(
+                    model.generate_content,
+                    _build_marshaled_prompt(group),
+                    generation_config={
+                        "max_output_tokens": 1024 * len(group),
+                        "temperature": 0.7,
+                        "response_mime_type": "application/json",
+                        "response_schema": MARSHALED_RESPONSE_SCHEMA,
+                    },
+                    # Timing out in the SDK stops the call; wait_for can't stop the thread
+                    request_options={"timeout": timeout},
+                ),
+                timeout=timeout + TIMEOUT_GRACE_S,
+            )
+            elapsed = time.time() - start_time
+
+            answers = {item["id"]: item["answer"] for item in json.loads(response.text)}
+            logger.info(
+                "Marshaled batch of %d: %d answers in %.2fs", len(group), len(answers), elapsed
+            )
+
+            for i, req in enumerate(group, 1):
+                if answers.get(i):
+                    req.result = answers[i]
+                else:
+                    req.error = "Missing answer in marshaled response"
+
+        except Exception as e:
+            logger.error("Error processing marshaled batch: %s", e, exc_info=True)
+            for req in group:
+                req.error = str(e)
+        finally:
+            for req in group:
+                req.completed.set()
+
     async def _process_single(
         self, model, request: BatchRequest, content: dict
     ) -> None:
@@ -197,38 +473,96 @@ class LLMBatcher:
             content: Formatted content for the API
         """
         try:
-            # Generate response
+            # Generate response, retrying once on timeout
             start_time = time.time()
-            response = await asyncio.to_thread(
-                model.generate_content,
-                content["parts"][0]["text"],
-                generation_config={
-                    "max_output_tokens": 1024,  # Sufficient for 4-5 sentence responses
-                    "temperature": 0.7,
-                },
-            )
+            for attempt in range(2):
+                try:
+                    response = await asyncio.wait_for(
+                        asyncio.to_thread(
+                            model.generate_content,
+                            content["parts"][0]["text"],
+                            generation_config={
+                                "max_output_tokens": 1024,  # Sufficient for 4-5 sentence responses
+                                "temperature": 0.7,
+                            },
+                            # Timing out in the SDK stops the call, so retries don't pile up
+                            request_options={"timeout": settings.llm_timeout_s},
+                        ),
+                        timeout=settings.llm_timeout_s + TIMEOUT_GRACE_S,
+                    )
+                    break
+                except TIMEOUT_ERRORS:
+                    logger.warning("Batch request %s timed out (attempt %d)", request.id, attempt + 1)
+            else:
+                # Gemini timed out twice: fall back to Groq
+                request.result = await self._generate_with_groq(request)
+                if request.result is None:
+                    request.error = "Gemini timed out and Groq fallback failed"
+                return
 
             elapsed = time.time() - start_time
 
             # Check finish reason for truncation
             finish_reason = response.candidates[0].finish_reason if response.candidates else None
-            logger.info(f"Batch request {request.id} finish_reason: {finish_reason}")
+            logger.info("Batch request %s finish_reason: %s", request.id, finish_reason)
 
             request.result = response.text
-            logger.info(f"Batch request {request.id}: {len(response.text)} chars in {elapsed:.2f}s")
+            logger.info(
+                "Batch request %s: %d chars in %.2fs", request.id, len(response.text), elapsed
+            )
 
             # Validate response is complete
             if finish_reason == 1:  # MAX_TOKENS
-                logger.warning(f"Batch response truncated due to MAX_TOKENS limit")
+                logger.warning("Batch response truncated due to MAX_TOKENS limit")
             elif not response.text.endswith((".", "!", "?")):
-                logger.warning(f"Batch response may be truncated: {response.text[-50:]}")
+                logger.warning("Batch response may be truncated: %s", response.text[-50:])
 
         except Exception as e:
-            logger.error(f"Error processing batch request {request.id}: {e}", exc_info=True)
+            logger.error("Error processing batch request %s: %s", request.id, e, exc_info=True)
             request.error = str(e)
         finally:
             request.completed.set()
 
+    async def _generate_with_groq(self, request: BatchRequest) -> Optional[str]:
+        """Generate a full response for a request with Groq.
+
+        Args:
+            request: BatchRequest to answer
+
+        Returns:
+            Generated response string or None if failed
+        """
+        chunks = []
+        async for chunk in generate_response_stream_groq(
+            request.query, request.verses, request.language,
+            api_key=request.groq_api_key,
+        ):
+            if chunk is None:
+                return None
+            chunks.append(chunk)
+        return "".join(chunks) or None
+
+
+def _build_marshaled_prompt(batch: list[BatchRequest]) -> str:
+    """Combine several requests into one prompt answered as a JSON array.
+
+    Args:
+        batch: BatchRequest objects to answer together
+
+    Returns:
+        Prompt asking for one ``{"id", "answer"}`` object per question
+    """
+    sections = [
+        f"### Question {i}\n{_build_prompt(req.query, req.verses, req.language)}"
+        for i, req in enumerate(batch, 1)
+    ]
+    return (
+        f"Answer each of the following {len(batch)} questions independently, "
+        "following the instructions given with each one. Respond with a JSON array "
+        'containing one {"id": <question number>, "answer": "<answer>"} object per question.\n\n'
+        + "\n\n".join(sections)
+    )
+
 
 # Global batcher instance
 _batcher: Optional[LLMBatcher] = None
@@ -274,10 +608,8 @@ async def batched_generate_response(
             groq_api_key=groq_api_key,
         )
     except Exception as e:
-        print(f"Batched generation error: {e}")
+        logger.error("Batched generation error: %s", e)
         # Fall back to direct processing
-        from llm import generate_contextual_response
-
         return generate_contextual_response(
             query, verses, language,
             gemini_api_key=gemini_api_key,
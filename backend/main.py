@@ -3,6 +3,7 @@
 Main entry point for the API server.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -29,6 +30,47 @@ async def lifespan(app: FastAPI):
     # Startup
     print("Starting Bible RAG API...")
 
+    # Import the LLM SDKs and build the default clients now, so the first
+    # search doesn't pay for them
+    from llm import (
+        _get_gemini_model,
+        _get_groq_client,
+        _get_system_gemini_model,
+        close_http_client,
+    )
+    from llm_batcher import get_batcher
+    from reranker_batcher import get_rerank_batcher
+
+    try:
+        if settings.gemini_api_key:
+            await _get_system_gemini_model(settings.gemini_api_key)
+            _get_gemini_model(settings.gemini_api_key, system_instruction=None)
+        if settings.groq_api_key:
+            _get_groq_client(settings.groq_api_key)
+    except Exception as e:
+        print(f"LLM client preload failed: {e}")
+
+    if settings.enable_batching:
+        await get_batcher().start()
+
+    if settings.enable_reranking and settings.enable_rerank_batching:
+        await get_rerank_batcher().start()
+
+    if settings.enable_reranking and settings.reranker_warmup:
+        from reranker import warmup_reranker
+
+        print("Warming up reranker...")
+        try:
+            # Model loading blocks, so keep the event loop free while it runs
+            await asyncio.to_thread(warmup_reranker)
+            print("Reranker ready!")
+        except Exception as e:
+            print(f"Reranker warmup failed: {e}")
+
+    # Pydantic builds model schemas at import, but FastAPI generates the
+    # OpenAPI document on the first /docs or /openapi.json request
+    app.openapi()
+
     # Optionally preload the embedding model
     # Uncomment to preload at startup (uses ~4GB RAM)
     # from embeddings import get_embedding_model
@@ -40,6 +82,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("Shutting down Bible RAG API...")
+    await get_batcher().stop()
+    await get_rerank_batcher().stop()
+    await close_http_client()
 
 
 # Create FastAPI app
@@ -103,4 +148,5 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=settings.workers,
     )
@@ -0,0 +1,77 @@
+"""Add composite index for ordered original word lookups.
+
+This migration replaces the single-column index on original_words(verse_id)
+with a composite index on (verse_id, word_order), so fetching a verse's
+words in order is served by the index without a separate sort.
+
+Run this after the database schema is created.
+"""
+
+from sqlalchemy import text
+
+from database import SessionLocal
+
+
+def upgrade():
+    """Add the composite index and drop the index it supersedes."""
+    print("Adding composite index idx_original_words_verse_order...")
+
+    db = SessionLocal()
+    try:
+        # CONCURRENT index creation cannot run inside a transaction
+        conn = db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+
+        conn.execute(
+            text(
+                """
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_original_words_verse_order
+                ON original_words (verse_id, word_order)
+                """
+            )
+        )
+        print("✓ Composite index created successfully!")
+
+        # verse_id lookups are covered by the leading column of the new index
+        conn.execute(text("DROP INDEX CONCURRENTLY IF EXISTS idx_original_words_verse"))
+        print("✓ Removed superseded index idx_original_words_verse")
+
+    except Exception as e:
+        print(f"✗ Error creating index: {e}")
+        raise
+    finally:
+        db.close()
+
+
+def downgrade():
+    """Restore the single-column index and remove the composite index."""
+    db = SessionLocal()
+    try:
+        print("Removing composite index idx_original_words_verse_order...")
+
+        db.execute(
+            text(
+                """
+                CREATE INDEX IF NOT EXISTS idx_original_words_verse
+                ON original_words (verse_id)
+                """
+            )
+        )
+        db.execute(text("DROP INDEX IF EXISTS idx_original_words_verse_order"))
+        db.commit()
+        print("✓ Composite index removed successfully!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"✗ Error removing index: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "downgrade":
+        downgrade()
+    else:
+        upgrade()
@@ -6,17 +6,29 @@ This module handles:
 3. Integrating morphological data
 """
 
+import asyncio
+import io
+import itertools
 import json
 import logging
 import re
-from typing import Dict, List, Optional
-from uuid import UUID
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from uuid import UUID, uuid4
 
 import requests
-from sqlalchemy import and_, select
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
-from database import Book, OriginalWord, SessionLocal, Verse
+from config import get_settings
+from database import Book, OriginalWord, SessionLocal, Verse, copy_rows
 
 # httpx is optional - only needed for async version
 try:
@@ -25,8 +37,245 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+# h2 is optional - without it httpx clients fall back to HTTP/1.1
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson is optional - parses the large Strong's JS dictionaries faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# hyperscan is optional - only speeds up bulk Strong's number scanning
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Same matches as r"\b([GH]\d{1,5})\b", but starting with the [GH] class lets the
+# regex engine skip ahead to candidate letters; the lookbehind restores the
+# leading word boundary
+_STRONGS_RE = re.compile(r"[GH](?<!\w[GH])\d{1,5}\b")
+
+# Strong's .dat format markers
+_DAT_NUMBER_RE = re.compile(r"\\?0*(\d{1,5})\\?")
+
+# Hyperscan database for the same pattern, compiled on first bulk scan
+_strongs_hs_db = None
+_strongs_hs_lock = threading.Lock()
+
+# On-disk Strong's store: one row per entry, plus the ETag and fetch time of each source URL
+_STRONGS_DB_VERSION = 1
+_STRONGS_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    url TEXT PRIMARY KEY,
+    etag TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strongs (
+    url TEXT NOT NULL,
+    number TEXT NOT NULL,
+    lemma TEXT NOT NULL,
+    translit TEXT NOT NULL,
+    definition TEXT,
+    PRIMARY KEY (url, number)
+) WITHOUT ROWID;
+"""
+
+
+# Column order of the rows _copy_original_words streams
+_ORIGINAL_WORDS_COPY_SQL = (
+    "COPY original_words (id, verse_id, word, language, strongs_number, transliteration, "
+    "morphology, definition, word_order, created_at) FROM STDIN"
+)
+
+
+class StrongsEntry(NamedTuple):
+    """Compact Strong's entry holding only the fields used for enrichment."""
+
+    lemma: str
+    translit: str
+    definition: Optional[str]
+
+
+# Strong's dictionaries shared by every manager in the process, keyed by language
+_STRONGS: Dict[str, Dict[str, StrongsEntry]] = {}
+_STRONGS_LOCK = threading.Lock()
+
+# Dictionary each language is looked up in (Biblical Aramaic is numbered in Hebrew Strong's)
+_STRONGS_SOURCE = {"greek": "greek", "hebrew": "hebrew", "aramaic": "hebrew"}
+
+
+@lru_cache(maxsize=4096)
+def _lookup_strongs(source: str, strongs_number: str) -> Optional[StrongsEntry]:
+    """Memoized Strong's lookup; cleared whenever the shared data is replaced."""
+    return _STRONGS[source].get(strongs_number)
+
+
+def _get_strongs_hs_db() -> "hyperscan.Database":
+    """Get the compiled Hyperscan database for Strong's numbers."""
+    global _strongs_hs_db
+    if _strongs_hs_db is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[rb"\b[GH]\d{1,5}\b"],
+            ids=[0],
+            # UTF8/UCP keep word boundaries consistent with Python's Unicode-aware re
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP],
+        )
+        _strongs_hs_db = db
+    return _strongs_hs_db
+
+
+def _collect_strongs_match(match_id: int, start: int, end: int, flags: int, context: tuple) -> None:
+    """Hyperscan match handler appending the matched Strong's number."""
+    data, matches = context
+    matches.append(data[start:end].decode("ascii"))
+
+
+def _connect_strongs_db() -> sqlite3.Connection:
+    """Open the on-disk Strong's store, creating it if needed."""
+    path = Path(get_settings().strongs_cache_dir).expanduser() / "strongs.sqlite"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _STRONGS_DB_VERSION:
+        # The store is only a cache, so an outdated layout is dropped and refetched
+        conn.executescript("DROP TABLE IF EXISTS sources; DROP TABLE IF EXISTS strongs;")
+        conn.execute(f"PRAGMA user_version = {_STRONGS_DB_VERSION}")
+    conn.executescript(_STRONGS_DB_SCHEMA)
+    return conn
+
+
+def _compact_strongs(raw: Dict) -> Dict[str, StrongsEntry]:
+    """Reduce upstream Strong's entries to the fields this module reads.
+
+    Args:
+        raw: Parsed upstream dictionary keyed by Strong's number.
+
+    Returns:
+        Dictionary mapping Strong's numbers to compact entries.
+    """
+    # Interned keys let lookups with other interned numbers match by identity
+    return {
+        sys.intern(number): StrongsEntry(
+            entry.get("lemma") or "",
+            entry.get("translit") or "",
+            # Use strongs_def (primary definition) or kjv_def as fallback
+            entry.get("strongs_def") or entry.get("kjv_def"),
+        )
+        for number, entry in raw.items()
+    }
+
+
+def _read_strongs_cache(
+    url: str,
+) -> tuple[Optional[Dict[str, StrongsEntry]], Optional[str], float]:
+    """Load a previously parsed Strong's dictionary with its ETag and fetch time.
+
+    Args:
+        url: Source URL the data was fetched from.
+
+    Returns:
+        Tuple of (data, etag, fetched_at), or (None, None, 0.0) if nothing usable is cached.
+    """
+    try:
+        with closing(_connect_strongs_db()) as conn:
+            source = conn.execute(
+                "SELECT etag, fetched_at FROM sources WHERE url = ?", (url,)
+            ).fetchone()
+            if source is None:
+                return None, None, 0.0
+            rows = conn.execute(
+                "SELECT number, lemma, translit, definition FROM strongs WHERE url = ?", (url,)
+            )
+            data = {sys.intern(number): StrongsEntry(*entry) for number, *entry in rows}
+    except (OSError, sqlite3.Error):
+        return None, None, 0.0
+    return data, *source
+
+
+def _strongs_cache_is_fresh(fetched_at: float) -> bool:
+    """Whether a cached source is recent enough to use without revalidating."""
+    return time.time() - fetched_at < get_settings().strongs_cache_max_age
+
+
+def _touch_strongs_cache(url: str) -> None:
+    """Mark a cached source as just revalidated (e.g. after a 304 response).
+
+    Args:
+        url: Source URL the data was fetched from.
+    """
+    try:
+        with closing(_connect_strongs_db()) as conn, conn:
+            conn.execute("UPDATE sources SET fetched_at = ? WHERE url = ?", (time.time(), url))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to update Strong's cache for %s: %s", url, e)
+
+
+def _write_strongs_cache(url: str, etag: Optional[str], data: Dict[str, StrongsEntry]) -> None:
+    """Persist a parsed Strong's dictionary so later loads can revalidate by ETag.
+
+    Args:
+        url: Source URL the data was fetched from.
+        etag: ETag response header; nothing is cached without one.
+        data: Compact Strong's dictionary.
+    """
+    if not etag or not data:
+        return
+
+    try:
+        # Replace the URL's entries and ETag together in one transaction
+        with closing(_connect_strongs_db()) as conn, conn:
+            conn.execute("DELETE FROM strongs WHERE url = ?", (url,))
+            conn.executemany(
+                "INSERT INTO strongs (url, number, lemma, translit, definition) VALUES (?, ?, ?, ?, ?)",
+                ((url, number, *entry) for number, entry in data.items()),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sources (url, etag, fetched_at) VALUES (?, ?, ?)",
+                (url, etag, time.time()),
+            )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Failed to write Strong's cache for %s: %s", url, e)
+
+
+def _stream_get(client: Any, url: str, headers: Optional[Dict[str, str]]):
+    """Open a streaming GET whose body is read lazily.
+
+    Args:
+        client: ``httpx.Client`` or ``requests.Session``.
+        url: URL to fetch.
+        headers: Extra request headers.
+
+    Returns:
+        Context-managed response.
+    """
+    if isinstance(client, requests.Session):
+        return client.get(url, headers=headers, timeout=60, stream=True)
+    return client.stream("GET", url, headers=headers, timeout=60)
+
+
+def _iter_response_lines(response: Any) -> Iterable[str]:
+    """Iterate the decoded lines of a streaming response.
+
+    Args:
+        response: Response returned by ``_stream_get``.
+
+    Returns:
+        Iterator over body lines without line terminators.
+    """
+    if isinstance(response, requests.Response):
+        return response.iter_lines(decode_unicode=True)
+    return response.iter_lines()
+
 
 class OriginalLanguageManager:
     """Manages original language word data for Bible verses."""
@@ -39,6 +288,9 @@ class OriginalLanguageManager:
     STRONGS_GREEK_DAT_URL = "https://raw.githubusercontent.com/openscriptures/strongs/master/greek/strongsgreek.dat"
     STRONGS_HEBREW_DAT_URL = "https://raw.githubusercontent.com/openscriptures/strongs/master/hebrew/strongshebrew.dat"
 
+    # References per batched verse lookup query
+    VERSE_LOOKUP_CHUNK_SIZE = 1000
+
     def __init__(self, db: Optional[Session] = None):
         """Initialize the original language manager.
 
@@ -47,15 +299,45 @@ class OriginalLanguageManager:
         """
         self.db = db or SessionLocal()
         self._should_close_db = db is None
-        self.strongs_hebrew_data: Optional[Dict] = None
-        self.strongs_greek_data: Optional[Dict] = None
 
-    def __del__(self):
+    def __enter__(self) -> "OriginalLanguageManager":
+        """Use the manager as a context manager that releases its session on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         """Close database session if we created it."""
         if self._should_close_db and self.db:
             self.db.close()
 
-    def _parse_js_dictionary(self, js_text: str) -> Dict:
+    @property
+    def strongs_hebrew_data(self) -> Optional[Dict]:
+        """Hebrew Strong's data shared across managers, or None if not loaded."""
+        return _STRONGS.get("hebrew")
+
+    @strongs_hebrew_data.setter
+    def strongs_hebrew_data(self, data: Optional[Dict]) -> None:
+        _STRONGS["hebrew"] = data
+        _lookup_strongs.cache_clear()
+
+    @property
+    def strongs_greek_data(self) -> Optional[Dict]:
+        """Greek Strong's data shared across managers, or None if not loaded."""
+        return _STRONGS.get("greek")
+
+    @strongs_greek_data.setter
+    def strongs_greek_data(self, data: Optional[Dict]) -> None:
+        _STRONGS["greek"] = data
+        _lookup_strongs.cache_clear()
+
+    def _load_strongs_once(self) -> None:
+        """Fetch Strong's data unless it is already loaded in this process."""
+        with _STRONGS_LOCK:
+            if _STRONGS.get("hebrew") and _STRONGS.get("greek"):
+                return
+            logger.info("Loading Strong's definitions...")
+            self.fetch_strongs_data_sync()
+
+    def _parse_js_dictionary(self, js_text: str | bytes) -> Dict:
         """Parse JavaScript dictionary format to Python dict.
 
         The data format is:
@@ -63,42 +345,51 @@ class OriginalLanguageManager:
         module.exports = strongsGreekDictionary;
 
         Some entries may have problematic characters, so we use a robust approach.
+        Raw response bytes are accepted so the multi-megabyte body can be handed
+        straight to ``json.loads`` without first decoding it into a ``str``.
 
         Args:
-            js_text: JavaScript source code containing dictionary.
+            js_text: JavaScript source code containing dictionary, as text or bytes.
 
         Returns:
             Parsed dictionary.
         """
-        import re
+        if isinstance(js_text, bytes):
+            start_marker, end_marker, newline = b"= {", b"};", b"\n"
+        else:
+            start_marker, end_marker, newline = "= {", "};", "\n"
 
         # Find the start of the dictionary object
-        dict_start = js_text.find('= {')
+        dict_start = js_text.find(start_marker)
         if dict_start == -1:
             logger.error("Could not find dictionary start")
             return {}
 
         # Find the end - look for "}; module.exports" or similar
-        dict_end = js_text.rfind('};')
+        dict_end = js_text.rfind(end_marker)
         if dict_end == -1:
             logger.error("Could not find dictionary end")
             return {}
 
-        # Extract the JSON object (including the braces)
-        json_str = js_text[dict_start + 2:dict_end + 1]  # +2 to skip "= ", +1 to include final }
+        # Bounds of the JSON object: skip "= ", include the final }
+        start, end = dict_start + 2, dict_end + 1
 
-        # Parse as JSON with error recovery
+        # Parse as JSON with error recovery (orjson.JSONDecodeError subclasses json's)
         try:
-            data = json.loads(json_str)
-            return data
+            if ORJSON_AVAILABLE:
+                # orjson reads a memoryview in place, so slicing bytes copies nothing
+                if isinstance(js_text, bytes):
+                    return orjson.loads(memoryview(js_text)[start:end])
+                return orjson.loads(js_text[start:end])
+            return json.loads(js_text[start:end])
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON at position {e.pos}: {e.msg}")
+            logger.error("Failed to parse JSON at position %s: %s", e.pos, e.msg)
             # Try to identify the problematic entry
-            lines = json_str[:e.pos].split('\n')
-            logger.error(f"Error near line {len(lines)}: {lines[-1] if lines else 'unknown'}")
+            lines = js_text[start:start + e.pos].split(newline)
+            logger.error("Error near line %s: %s", len(lines), lines[-1] if lines else "unknown")
             return {}
 
-    def _parse_dat_format(self, dat_text: str, language: str) -> Dict:
+    def _parse_dat_format(self, dat_lines: str | Iterable[str], language: str) -> Dict:
         """Parse Strong's .dat file format to dictionary.
 
         The format is:
@@ -109,8 +400,11 @@ class OriginalLanguageManager:
          the last letter of the Greek alphabet, i.e. (figuratively) the
          finality:--Omega.
 
+        Lines are consumed in a single pass, keeping only the current entry in
+        memory, so a streamed response can be parsed without holding the file.
+
         Args:
-            dat_text: .dat file content
+            dat_lines: .dat file content, or an iterable of its lines
             language: "greek" or "hebrew" for prefix
 
         Returns:
@@ -119,128 +413,205 @@ class OriginalLanguageManager:
         prefix = "G" if language == "greek" else "H"
         strongs_dict = {}
 
-        # Split into entries using $$T marker
-        entries = re.split(r'\$\$T0+', dat_text)
+        if isinstance(dat_lines, str):
+            dat_lines = io.StringIO(dat_lines)
+
+        strongs_number = None
+        lemma = ""
+        translit = ""
+        definition_lines: List[str] = []
+        found_lemma_line = False
+
+        # A trailing sentinel marker flushes the last entry
+        for line in itertools.chain(dat_lines, ("$$T",)):
+            if line.startswith("$$T"):
+                # Combine definition lines; only add if we have a definition
+                definition = " ".join(definition_lines).strip()
+                if strongs_number and definition:
+                    strongs_dict[strongs_number] = {
+                        "lemma": lemma,
+                        "translit": translit,
+                        "strongs_def": definition,
+                        "kjv_def": definition  # Same as definition for .dat format
+                    }
+
+                # Start the next entry; the marker ends in the padded number, e.g. 0005598
+                digits = line[3:].strip().lstrip("0")
+                if digits.isdecimal() and len(digits) <= 5:
+                    strongs_number = prefix + digits
+                else:
+                    number_match = _DAT_NUMBER_RE.search(digits)
+                    strongs_number = prefix + number_match.group(1) if number_match else None
+                lemma = ""
+                translit = ""
+                definition_lines = []
+                found_lemma_line = False
+                continue
 
-        for entry in entries:
-            if not entry.strip():
+            if strongs_number is None:
                 continue
 
-            lines = entry.strip().split('\n')
-            if not lines:
+            stripped = line.strip()
+            if not stripped:
                 continue
 
-            # First line after $$T is the number
-            first_line = lines[0]
+            # Look for line with: number lemma transliteration
+            # Example: " 8600  tphowtsah  tef-o-tsaw'"
+            if not found_lemma_line:
+                parts = stripped.split(None, 2)  # Split on whitespace, max 3 parts
+                if len(parts) >= 3 and parts[0].isdecimal():
+                    # parts[0] is number, parts[1] is lemma, parts[2] is transliteration
+                    lemma = parts[1]
+                    translit = parts[2]
+                    found_lemma_line = True
+                    continue
 
-            # Look for number pattern like \05598\ or just 5598
-            number_match = re.search(r'\\?0*(\d{1,5})\\?', first_line)
-            if not number_match:
+            # Skip "see GREEK" / "see HEBREW" references
+            if stripped.startswith(('see GREEK', 'see HEBREW')):
                 continue
 
-            strongs_number = prefix + number_match.group(1)
+            # Everything else is definition
+            definition_lines.append(stripped)
 
-            # Parse the definition line (format: " 5598  lemma  transliteration")
-            lemma = ""
-            translit = ""
-            definition_lines = []
+        logger.info("Parsed %s entries from .dat file", len(strongs_dict))
+        return strongs_dict
 
-            found_lemma_line = False
-            for i, line in enumerate(lines):
-                # Skip the number line
-                if i == 0:
-                    continue
+    async def _get_cached_async(
+        self, client: "httpx.AsyncClient", url: str, parse: Callable[[Any], Dict]
+    ) -> Dict[str, StrongsEntry]:
+        """GET a Strong's data file, reusing the disk cache when the ETag still matches.
 
-                stripped = line.strip()
-                if not stripped:
-                    continue
+        A source fetched within ``strongs_cache_max_age`` seconds is returned from
+        the cache without any request.
 
-                # Look for line with: number lemma transliteration
-                # Example: " 8600  tphowtsah  tef-o-tsaw'"
-                if not found_lemma_line and re.match(r'^\s*\d+\s+\S+\s+\S', line):
-                    parts = stripped.split(None, 2)  # Split on whitespace, max 3 parts
-                    if len(parts) >= 3:
-                        # parts[0] is number, parts[1] is lemma, parts[2] is transliteration
-                        lemma = parts[1]
-                        translit = parts[2]
-                        found_lemma_line = True
-                    continue
+        Args:
+            client: Shared async HTTP client.
+            url: Data file URL.
+            parse: Parses a fresh response into an upstream-format dictionary.
 
-                # Skip "see GREEK" / "see HEBREW" references
-                if stripped.startswith('see GREEK') or stripped.startswith('see HEBREW'):
-                    continue
+        Returns:
+            Compact Strong's dictionary.
+        """
+        # The SQLite cache is blocking, so keep it off the event loop
+        cached, etag, fetched_at = await asyncio.to_thread(_read_strongs_cache, url)
+        if cached and _strongs_cache_is_fresh(fetched_at):
+            logger.info("Using cached Strong's data for %s", url)
+            return cached
+        headers = {"If-None-Match": etag} if cached and etag else None
+
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            logger.info("Strong's data unchanged, using cache for %s", url)
+            await asyncio.to_thread(_touch_strongs_cache, url)
+            return cached
+        response.raise_for_status()
+
+        data = _compact_strongs(parse(response))
+        await asyncio.to_thread(_write_strongs_cache, url, response.headers.get("ETag"), data)
+        return data
+
+    def _get_cached_sync(
+        self, client: Any, url: str, parse: Callable[[Iterable[str]], Dict]
+    ) -> Dict[str, StrongsEntry]:
+        """Synchronous counterpart of ``_get_cached_async``.
+
+        A source fetched within ``strongs_cache_max_age`` seconds is returned from
+        the cache without any request.
+
+        The body is streamed line by line into ``parse`` so the whole file never
+        has to be held in memory.
 
-                # Everything else is definition
-                definition_lines.append(stripped)
+        Args:
+            client: ``httpx.Client`` or ``requests.Session`` shared across fetches.
+            url: Data file URL.
+            parse: Parses the response lines into an upstream-format dictionary.
 
-            # Combine definition lines
-            definition = ' '.join(definition_lines).strip()
+        Returns:
+            Compact Strong's dictionary.
+        """
+        cached, etag, fetched_at = _read_strongs_cache(url)
+        if cached and _strongs_cache_is_fresh(fetched_at):
+            logger.info("Using cached Strong's data for %s", url)
+            return cached
+        headers = {"If-None-Match": etag} if cached and etag else None
+
+        with _stream_get(client, url, headers) as response:
+            if response.status_code == 304:
+                logger.info("Strong's data unchanged, using cache for %s", url)
+                _touch_strongs_cache(url)
+                return cached
+            response.raise_for_status()
+
+            data = _compact_strongs(parse(_iter_response_lines(response)))
+            etag = response.headers.get("ETag")
+
+        _write_strongs_cache(url, etag, data)
+        return data
+
+    async def _fetch_with_fallback(
+        self, client: "httpx.AsyncClient", js_url: str, dat_url: str, language: str
+    ) -> Dict:
+        """Fetch Strong's data for one language, trying JS format then .dat.
 
-            # Only add if we have a definition
-            if definition:
-                strongs_dict[strongs_number] = {
-                    "lemma": lemma,
-                    "translit": translit,
-                    "strongs_def": definition,
-                    "kjv_def": definition  # Same as definition for .dat format
-                }
+        Args:
+            client: Shared async HTTP client.
+            js_url: URL of the JavaScript dictionary.
+            dat_url: URL of the .dat fallback.
+            language: "greek" or "hebrew".
 
-        logger.info(f"Parsed {len(strongs_dict)} entries from .dat file")
-        return strongs_dict
+        Returns:
+            Compact Strong's dictionary, or an empty dict if both formats fail.
+        """
+        label = language.capitalize()
+
+        try:
+            logger.info("Fetching %s data from %s", label, js_url)
+            return await self._get_cached_async(
+                client, js_url, lambda r: self._parse_js_dictionary(r.content)
+            )
+        except Exception as e:
+            logger.warning("Failed to fetch %s JS format: %s", label, e)
+            logger.info("Trying .dat format: %s", dat_url)
+            try:
+                return await self._get_cached_async(
+                    client, dat_url, lambda r: self._parse_dat_format(r.text, language)
+                )
+            except Exception as dat_error:
+                logger.error("Failed to fetch %s .dat format: %s", label, dat_error)
+                return {}
 
     async def fetch_strongs_data(self) -> tuple[Dict, Dict]:
         """Fetch Strong's concordance data from GitHub (async version).
 
-        Tries JavaScript format first, falls back to .dat format if unavailable.
+        Hebrew and Greek are fetched concurrently over a single HTTP/2 client.
+        Each tries JavaScript format first, falls back to .dat format if unavailable.
 
         Returns:
             Tuple of (hebrew_data, greek_data) dictionaries.
 
         Raises:
-            httpx.HTTPError: If fetching data fails.
+            ImportError: If httpx is not installed.
         """
         if not HTTPX_AVAILABLE:
             raise ImportError("httpx is required for async operations. Use fetch_strongs_data_sync() instead.")
 
         logger.info("Fetching Strong's concordance data...")
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Try Hebrew data - JavaScript first, then .dat
-            hebrew_data = {}
-            try:
-                logger.info(f"Fetching Hebrew data from {self.STRONGS_HEBREW_URL}")
-                hebrew_response = await client.get(self.STRONGS_HEBREW_URL)
-                hebrew_response.raise_for_status()
-                hebrew_data = self._parse_js_dictionary(hebrew_response.text)
-            except Exception as e:
-                logger.warning(f"Failed to fetch Hebrew JS format: {e}")
-                logger.info(f"Trying .dat format: {self.STRONGS_HEBREW_DAT_URL}")
-                try:
-                    hebrew_dat_response = await client.get(self.STRONGS_HEBREW_DAT_URL)
-                    hebrew_dat_response.raise_for_status()
-                    hebrew_data = self._parse_dat_format(hebrew_dat_response.text, "hebrew")
-                except Exception as dat_error:
-                    logger.error(f"Failed to fetch Hebrew .dat format: {dat_error}")
-
-            # Try Greek data - JavaScript first, then .dat
-            greek_data = {}
-            try:
-                logger.info(f"Fetching Greek data from {self.STRONGS_GREEK_URL}")
-                greek_response = await client.get(self.STRONGS_GREEK_URL)
-                greek_response.raise_for_status()
-                greek_data = self._parse_js_dictionary(greek_response.text)
-            except Exception as e:
-                logger.warning(f"Failed to fetch Greek JS format: {e}")
-                logger.info(f"Trying .dat format: {self.STRONGS_GREEK_DAT_URL}")
-                try:
-                    greek_dat_response = await client.get(self.STRONGS_GREEK_DAT_URL)
-                    greek_dat_response.raise_for_status()
-                    greek_data = self._parse_dat_format(greek_dat_response.text, "greek")
-                except Exception as dat_error:
-                    logger.error(f"Failed to fetch Greek .dat format: {dat_error}")
+        async with httpx.AsyncClient(timeout=60.0, http2=HTTP2_AVAILABLE) as client:
+            hebrew_task = asyncio.create_task(
+                self._fetch_with_fallback(
+                    client, self.STRONGS_HEBREW_URL, self.STRONGS_HEBREW_DAT_URL, "hebrew"
+                )
+            )
+            greek_task = asyncio.create_task(
+                self._fetch_with_fallback(
+                    client, self.STRONGS_GREEK_URL, self.STRONGS_GREEK_DAT_URL, "greek"
+                )
+            )
+            hebrew_data, greek_data = await asyncio.gather(hebrew_task, greek_task)
 
         logger.info(
-            f"Fetched {len(hebrew_data)} Hebrew entries and {len(greek_data)} Greek entries"
+            "Fetched %s Hebrew entries and %s Greek entries", len(hebrew_data), len(greek_data)
         )
 
         self.strongs_hebrew_data = hebrew_data
@@ -248,6 +619,29 @@ class OriginalLanguageManager:
 
         return hebrew_data, greek_data
 
+    @staticmethod
+    def _sync_client():
+        """Create a pooled HTTP client for synchronous fetches.
+
+        Uses ``httpx.Client`` with HTTP/2 so both files share one connection,
+        falling back to a ``requests.Session`` when httpx is not installed.
+
+        Returns:
+            Context-managed HTTP client.
+        """
+        headers = {"Accept-Encoding": "gzip"}
+        if HTTPX_AVAILABLE:
+            return httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=60.0,
+                headers=headers,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            )
+
+        session = requests.Session()
+        session.headers.update(headers)
+        return session
+
     def fetch_strongs_data_sync(self) -> tuple[Dict, Dict]:
         """Fetch Strong's concordance data synchronously (for use in scripts).
 
@@ -258,28 +652,33 @@ class OriginalLanguageManager:
         """
         logger.info("Fetching Strong's concordance data (synchronous)...")
 
-        # Try Hebrew data - .dat format
-        hebrew_data = {}
-        try:
-            logger.info(f"Fetching Hebrew .dat from {self.STRONGS_HEBREW_DAT_URL}")
-            hebrew_response = requests.get(self.STRONGS_HEBREW_DAT_URL, timeout=60)
-            hebrew_response.raise_for_status()
-            hebrew_data = self._parse_dat_format(hebrew_response.text, "hebrew")
-        except Exception as e:
-            logger.error(f"Failed to fetch Hebrew .dat format: {e}")
+        with self._sync_client() as client:
+            # Try Hebrew data - .dat format
+            hebrew_data = {}
+            try:
+                logger.info("Fetching Hebrew .dat from %s", self.STRONGS_HEBREW_DAT_URL)
+                hebrew_data = self._get_cached_sync(
+                    client,
+                    self.STRONGS_HEBREW_DAT_URL,
+                    lambda lines: self._parse_dat_format(lines, "hebrew"),
+                )
+            except Exception as e:
+                logger.error("Failed to fetch Hebrew .dat format: %s", e)
 
-        # Try Greek data - .dat format
-        greek_data = {}
-        try:
-            logger.info(f"Fetching Greek .dat from {self.STRONGS_GREEK_DAT_URL}")
-            greek_response = requests.get(self.STRONGS_GREEK_DAT_URL, timeout=60)
-            greek_response.raise_for_status()
-            greek_data = self._parse_dat_format(greek_response.text, "greek")
-        except Exception as e:
-            logger.error(f"Failed to fetch Greek .dat format: {e}")
+            # Try Greek data - .dat format
+            greek_data = {}
+            try:
+                logger.info("Fetching Greek .dat from %s", self.STRONGS_GREEK_DAT_URL)
+                greek_data = self._get_cached_sync(
+                    client,
+                    self.STRONGS_GREEK_DAT_URL,
+                    lambda lines: self._parse_dat_format(lines, "greek"),
+                )
+            except Exception as e:
+                logger.error("Failed to fetch Greek .dat format: %s", e)
 
         logger.info(
-            f"Fetched {len(hebrew_data)} Hebrew entries and {len(greek_data)} Greek entries"
+            "Fetched %s Hebrew entries and %s Greek entries", len(hebrew_data), len(greek_data)
         )
 
         self.strongs_hebrew_data = hebrew_data
@@ -289,37 +688,34 @@ class OriginalLanguageManager:
 
     def get_strongs_definition(
         self, strongs_number: str, language: str = "greek"
-    ) -> Optional[Dict]:
+    ) -> Optional[StrongsEntry]:
         """Get Strong's definition for a given number.
 
-        The data format from openscriptures/strongs is:
-        {
-            "strongs_def": " to love (in a social or moral sense)",
-            "kjv_def": "(be-)love(-ed)",
-            "lemma": "ἀγαπάω",
-            "translit": "agapáō",
-            "derivation": "..."
-        }
+        Entries are compacted from the openscriptures/strongs format at load time,
+        keeping ``lemma``, ``translit`` and ``strongs_def`` (or ``kjv_def``) as
+        ``StrongsEntry(lemma="ἀγαπάω", translit="agapáō", definition=" to love ...")``.
 
         Args:
             strongs_number: Strong's number (e.g., "G25", "H430").
-            language: Language ("greek" or "hebrew").
+            language: Language ("greek", "hebrew", or "aramaic").
 
         Returns:
-            Dictionary with definition data or None if not found.
+            Strong's entry or None if not found.
+
+        Raises:
+            ValueError: If the language has no Strong's dictionary.
         """
-        # Ensure data is loaded
-        if language == "greek" and not self.strongs_greek_data:
-            logger.warning("Greek Strong's data not loaded")
-            return None
-        if language == "hebrew" and not self.strongs_hebrew_data:
-            logger.warning("Hebrew Strong's data not loaded")
-            return None
+        source = _STRONGS_SOURCE.get(language)
+        if source is None:
+            raise ValueError(f"Unsupported language for Strong's lookup: {language}")
 
-        data = self.strongs_greek_data if language == "greek" else self.strongs_hebrew_data
+        data = _STRONGS.get(source)
+        if not data:
+            logger.warning("%s Strong's data not loaded", source.capitalize())
+            return None
 
         # The key includes the G/H prefix in the new format
-        return data.get(strongs_number)
+        return _lookup_strongs(source, strongs_number)
 
     def parse_strongs_from_text(self, text: str) -> List[str]:
         """Extract Strong's numbers from text.
@@ -332,9 +728,106 @@ class OriginalLanguageManager:
         Returns:
             List of Strong's numbers found.
         """
-        pattern = r"\b([GH]\d{1,5})\b"
-        matches = re.findall(pattern, text)
-        return matches
+        return _STRONGS_RE.findall(text)
+
+    def iter_strongs_from_text(self, text: str) -> Iterator[str]:
+        """Lazily yield Strong's numbers from text.
+
+        Unlike ``parse_strongs_from_text`` no list is built, so checks such as
+        ``any(...)`` or ``next(...)`` stop at the first match.
+
+        Args:
+            text: Text containing Strong's references.
+
+        Yields:
+            Strong's numbers in order of appearance.
+        """
+        for match in _STRONGS_RE.finditer(text):
+            yield match.group()
+
+    def parse_strongs_from_texts(self, texts: Iterable[str]) -> List[List[str]]:
+        """Extract Strong's numbers from many texts at once.
+
+        Scans with Hyperscan when it is installed, which matches in a single
+        DFA pass per text; otherwise falls back to the precompiled regex.
+
+        Args:
+            texts: Texts containing Strong's references.
+
+        Returns:
+            List of Strong's numbers found, one list per text.
+        """
+        if not HYPERSCAN_AVAILABLE:
+            return [_STRONGS_RE.findall(text) for text in texts]
+
+        db = _get_strongs_hs_db()
+        results = []
+        # Hyperscan scratch space is per database, so scans must not overlap
+        with _strongs_hs_lock:
+            for text in texts:
+                data = text.encode("utf-8")
+                matches: List[str] = []
+                db.scan(data, match_event_handler=_collect_strongs_match, context=(data, matches))
+                results.append(matches)
+        return results
+
+    def _resolve_many(
+        self, refs: Iterable[tuple[str, str]]
+    ) -> Dict[tuple[str, str], StrongsEntry]:
+        """Resolve Strong's entries for many (strongs_number, language) pairs at once.
+
+        Each distinct pair is looked up once, so loaders can enrich rows with a
+        plain dict lookup instead of a method call per word.
+
+        Args:
+            refs: (strongs_number, language) pairs; repeats are fine.
+
+        Returns:
+            Mapping of each pair that was found to its Strong's entry.
+        """
+        resolved = {}
+        for strongs_number, language in set(refs):
+            entry = self.get_strongs_definition(strongs_number, language)
+            if entry:
+                resolved[(strongs_number, language)] = entry
+        return resolved
+
+    def _resolve_verse_ids(self, book_column: Any, refs: Iterable[tuple]) -> Dict[tuple, UUID]:
+        """Look up verse IDs for many (book, chapter, verse) references at once.
+
+        Books are loaded once into a key-to-ID map, then verses are fetched with
+        one ``IN`` query on (book_id, chapter, verse) per chunk of references,
+        instead of a Book and a Verse SELECT per reference.
+
+        Args:
+            book_column: Book column the first element of each reference matches
+                (``Book.name`` or ``Book.book_number``).
+            refs: (book, chapter, verse) tuples.
+
+        Returns:
+            Mapping of reference to the ID of one matching verse (any translation).
+        """
+        book_ids = dict(self.db.execute(select(book_column, Book.id)).all())
+        book_keys = {book_id: key for key, book_id in book_ids.items()}
+
+        unique_refs = list(
+            dict.fromkeys(
+                (book_ids[book], chapter, verse_num)
+                for book, chapter, verse_num in refs
+                if book in book_ids
+            )
+        )
+        verse_ids: Dict[tuple, UUID] = {}
+
+        for start in range(0, len(unique_refs), self.VERSE_LOOKUP_CHUNK_SIZE):
+            chunk = unique_refs[start:start + self.VERSE_LOOKUP_CHUNK_SIZE]
+            stmt = select(Verse.book_id, Verse.chapter, Verse.verse, Verse.id).where(
+                tuple_(Verse.book_id, Verse.chapter, Verse.verse).in_(chunk)
+            )
+            for book_id, chapter, verse_num, verse_id in self.db.execute(stmt):
+                verse_ids.setdefault((book_keys[book_id], chapter, verse_num), verse_id)
+
+        return verse_ids
 
     def create_original_word(
         self,
@@ -366,13 +859,12 @@ class OriginalLanguageManager:
         if strongs_number and not definition:
             strongs_data = self.get_strongs_definition(strongs_number, language)
             if strongs_data:
-                # Use strongs_def (primary definition) or kjv_def as fallback
-                definition = strongs_data.get("strongs_def") or strongs_data.get("kjv_def")
+                definition = strongs_data.definition
                 if not transliteration:
-                    transliteration = strongs_data.get("translit")
+                    transliteration = strongs_data.translit
                 # Could also extract lemma (original script word)
                 if not word:
-                    word = strongs_data.get("lemma", "")
+                    word = strongs_data.lemma
 
         original_word = OriginalWord(
             verse_id=verse.id,
@@ -388,6 +880,65 @@ class OriginalLanguageManager:
         self.db.add(original_word)
         return original_word
 
+    def _insert_original_words(self, rows: List[Dict]) -> List[UUID]:
+        """Bulk insert original word rows and return their generated IDs.
+
+        Uses a single executemany INSERT with RETURNING, so the IDs come back
+        with the insert instead of needing a follow-up SELECT.
+
+        Args:
+            rows: OriginalWord column dictionaries.
+
+        Returns:
+            IDs of the inserted words, in row order.
+        """
+        if not rows:
+            return []
+        stmt = insert(OriginalWord).returning(OriginalWord.id, sort_by_parameter_order=True)
+        return list(self.db.scalars(stmt, rows).all())
+
+    def _copy_original_words(self, rows: List[Dict]) -> None:
+        """Bulk load original word rows with PostgreSQL ``COPY FROM STDIN``.
+
+        The ID and timestamp defaults are Python-side, so they are generated here.
+
+        Args:
+            rows: OriginalWord column dictionaries.
+        """
+        created_at = datetime.utcnow()
+        copy_rows(
+            self.db,
+            _ORIGINAL_WORDS_COPY_SQL,
+            (
+                (
+                    uuid4(),
+                    row["verse_id"],
+                    row["word"],
+                    row["language"],
+                    row["strongs_number"],
+                    row["transliteration"],
+                    row["morphology"],
+                    row["definition"],
+                    row["word_order"],
+                    created_at,
+                )
+                for row in rows
+            ),
+        )
+
+    def _write_original_words(self) -> Callable[[List[Dict]], Any]:
+        """Pick the fastest bulk writer for original word rows on this database.
+
+        Returns:
+            Callable writing a batch of OriginalWord column dictionaries: COPY on
+            PostgreSQL, an executemany INSERT elsewhere.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._copy_original_words
+
+        stmt = insert(OriginalWord)
+        return lambda rows: self.db.execute(stmt, rows)
+
     async def populate_from_original_text(
         self, translation_abbrev: str = "SBLGNT"
     ) -> int:
@@ -408,186 +959,191 @@ class OriginalLanguageManager:
         )
         return 0
 
-    def populate_greek_nt(self, verses_data: list[dict], batch_size: int = 100) -> int:
+    def populate_greek_nt(self, verses_data: list[dict], batch_size: int = 1000) -> int:
         """Populate Greek New Testament original words from OpenGNT data.
 
         Args:
             verses_data: List of verse dictionaries from fetch_opengnt()
-            batch_size: Number of verses to commit at once
+            batch_size: Number of words to insert per commit
 
         Returns:
             Number of words created
         """
         from tqdm import tqdm
 
-        logger.info(f"Populating Greek NT with {len(verses_data)} verses...")
+        logger.info("Populating Greek NT with %s verses...", len(verses_data))
 
         # Load Strong's definitions if not already loaded
-        if not self.strongs_greek_data:
-            logger.info("Loading Strong's Greek definitions...")
-            self.fetch_strongs_data_sync()
+        self._load_strongs_once()
 
         total_words = 0
         batch = []
 
-        for verse_data in tqdm(verses_data, desc="Populating Greek NT"):
-            # Find the verse in the database
-            book_query = select(Book).where(Book.book_number == verse_data["book_number"])
-            book = self.db.execute(book_query).scalar_one_or_none()
-
-            if not book:
-                logger.warning(f"Book {verse_data['book_number']} not found")
-                continue
+        # Resolve every verse up front (any translation's verse works)
+        verse_ids = self._resolve_verse_ids(
+            Book.book_number,
+            ((v["book_number"], v["chapter"], v["verse"]) for v in verses_data),
+        )
 
-            verse_query = (
-                select(Verse)
-                .where(Verse.book_id == book.id)
-                .where(Verse.chapter == verse_data["chapter"])
-                .where(Verse.verse == verse_data["verse"])
-                .limit(1)  # Get first matching verse (works across all translations)
-            )
-            verse = self.db.execute(verse_query).scalars().first()
+        strongs_entries = self._resolve_many(
+            (w["strongs"], "greek") for v in verses_data for w in v["words"] if w.get("strongs")
+        )
 
-            if not verse:
-                logger.warning(
-                    f"Verse not found: Book {verse_data['book_number']}, "
-                    f"Chapter {verse_data['chapter']}, Verse {verse_data['verse']}"
-                )
-                continue
+        # Bind hot-loop lookups to locals; entries are keyed by number alone here
+        strongs_lookup = {number: entry for (number, _), entry in strongs_entries.items()}.get
+        append = batch.append
+        write_batch, commit = self._write_original_words(), self.db.commit
 
-            # Add each word from this verse
-            for word_data in verse_data["words"]:
-                # Get Strong's definition if available
-                definition = None
-                if word_data.get("strongs"):
-                    strongs_data = self.get_strongs_definition(word_data["strongs"], "greek")
-                    if strongs_data:
-                        definition = strongs_data.get("strongs_def") or strongs_data.get("kjv_def")
-
-                original_word = OriginalWord(
-                    verse_id=verse.id,
-                    word=word_data["text"],
-                    language="greek",
-                    strongs_number=word_data.get("strongs"),
-                    transliteration=word_data.get("transliteration"),
-                    morphology=word_data.get("morphology"),
-                    definition=definition,
-                    word_order=word_data.get("word_order", 0),
+        # Batches are flushed explicitly, so skip autoflush on every execute
+        with self.db.no_autoflush:
+            for verse_data in tqdm(verses_data, desc="Populating Greek NT"):
+                verse_id = verse_ids.get(
+                    (verse_data["book_number"], verse_data["chapter"], verse_data["verse"])
                 )
 
-                batch.append(original_word)
-                total_words += 1
+                if not verse_id:
+                    logger.warning(
+                        "Verse not found: Book %s, Chapter %s, Verse %s",
+                        verse_data["book_number"],
+                        verse_data["chapter"],
+                        verse_data["verse"],
+                    )
+                    continue
 
-                # Commit in batches
-                if len(batch) >= batch_size:
-                    self.db.add_all(batch)
-                    self.db.commit()
-                    batch = []
+                # Add each word from this verse
+                for word_data in verse_data["words"]:
+                    get = word_data.get
+                    strongs_num = get("strongs")
+
+                    # Get Strong's definition if available
+                    strongs_data = strongs_lookup(strongs_num) if strongs_num else None
+                    definition = strongs_data.definition if strongs_data else None
+
+                    append({
+                        "verse_id": verse_id,
+                        "word": word_data["text"],
+                        "language": "greek",
+                        "strongs_number": strongs_num,
+                        "transliteration": get("transliteration"),
+                        "morphology": get("morphology"),
+                        "definition": definition,
+                        "word_order": get("word_order", 0),
+                    })
+                    total_words += 1
+
+                    # Commit in batches
+                    if len(batch) >= batch_size:
+                        write_batch(batch)
+                        commit()
+                        batch.clear()
 
         # Commit remaining words
         if batch:
-            self.db.add_all(batch)
-            self.db.commit()
+            write_batch(batch)
+            commit()
 
-        logger.info(f"✅ Created {total_words} Greek words")
+        logger.info("✅ Created %s Greek words", total_words)
         return total_words
 
-    def populate_hebrew_ot(self, verses_data: list[dict], batch_size: int = 100) -> int:
+    def populate_hebrew_ot(self, verses_data: list[dict], batch_size: int = 1000) -> int:
         """Populate Hebrew Old Testament original words from WLC/OSHB data.
 
         Args:
             verses_data: List of verse dictionaries from fetch_wlc_hebrew()
-            batch_size: Number of verses to commit at once
+            batch_size: Number of words to insert per commit
 
         Returns:
             Number of words created
         """
         from tqdm import tqdm
 
-        logger.info(f"Populating Hebrew OT with {len(verses_data)} verses...")
+        logger.info("Populating Hebrew OT with %s verses...", len(verses_data))
 
         # Load Strong's definitions if not already loaded
-        if not self.strongs_hebrew_data:
-            logger.info("Loading Strong's Hebrew definitions...")
-            self.fetch_strongs_data_sync()
+        self._load_strongs_once()
 
         total_words = 0
         batch = []
 
-        for verse_data in tqdm(verses_data, desc="Populating Hebrew OT"):
-            # Find the verse in the database using book name
-            book_name = verse_data.get("book")
-            if not book_name:
-                logger.warning(f"Missing book name in verse data")
-                continue
+        # Resolve every verse up front by book name (any translation's verse works)
+        verse_ids = self._resolve_verse_ids(
+            Book.name,
+            (
+                (v["book"], v["chapter"], v["verse"])
+                for v in verses_data
+                if v.get("book")
+            ),
+        )
 
-            book_query = select(Book).where(Book.name == book_name)
-            book = self.db.execute(book_query).scalar_one_or_none()
+        strongs_entries = self._resolve_many(
+            (w["strongs"], "hebrew") for v in verses_data for w in v["words"] if w.get("strongs")
+        )
 
-            if not book:
-                logger.warning(f"Book '{book_name}' not found in database")
-                continue
+        # Bind hot-loop lookups to locals; entries are keyed by number alone here
+        strongs_lookup = {number: entry for (number, _), entry in strongs_entries.items()}.get
+        append = batch.append
+        write_batch, commit = self._write_original_words(), self.db.commit
+
+        # Batches are flushed explicitly, so skip autoflush on every execute
+        with self.db.no_autoflush:
+            for verse_data in tqdm(verses_data, desc="Populating Hebrew OT"):
+                book_name = verse_data.get("book")
+                if not book_name:
+                    logger.warning("Missing book name in verse data")
+                    continue
 
-            verse_query = (
-                select(Verse)
-                .where(Verse.book_id == book.id)
-                .where(Verse.chapter == verse_data["chapter"])
-                .where(Verse.verse == verse_data["verse"])
-                .limit(1)  # Get first matching verse (works across all translations)
-            )
-            verse = self.db.execute(verse_query).scalars().first()
+                verse_id = verse_ids.get((book_name, verse_data["chapter"], verse_data["verse"]))
 
-            if not verse:
-                logger.warning(
-                    f"Verse not found: {book_name} {verse_data['chapter']}:{verse_data['verse']}"
-                )
-                continue
+                if not verse_id:
+                    logger.warning(
+                        "Verse not found: %s %s:%s", book_name, verse_data["chapter"], verse_data["verse"]
+                    )
+                    continue
 
-            # Determine language (Hebrew or Aramaic)
-            # Note: Daniel and Ezra have some Aramaic portions
-            language = verse_data.get("language", "hebrew")
+                # Determine language (Hebrew or Aramaic)
+                # Note: Daniel and Ezra have some Aramaic portions
+                language = verse_data.get("language", "hebrew")
 
-            # Add each word from this verse
-            for word_data in verse_data["words"]:
-                # Get Strong's definition and transliteration if available
-                definition = None
-                transliteration = word_data.get("transliteration")  # From WLC if available
-                strongs_num = word_data.get("strongs")
+                # Add each word from this verse
+                for word_data in verse_data["words"]:
+                    get = word_data.get
 
-                if strongs_num:
-                    strongs_data = self.get_strongs_definition(strongs_num, "hebrew")
+                    # Get Strong's definition and transliteration if available
+                    definition = None
+                    transliteration = get("transliteration")  # From WLC if available
+                    strongs_num = get("strongs")
+
+                    strongs_data = strongs_lookup(strongs_num) if strongs_num else None
                     if strongs_data:
-                        definition = strongs_data.get("strongs_def") or strongs_data.get("kjv_def")
+                        definition = strongs_data.definition
                         # Use Strong's transliteration if WLC doesn't provide one
                         if not transliteration:
-                            transliteration = strongs_data.get("translit")
-
-                original_word = OriginalWord(
-                    verse_id=verse.id,
-                    word=word_data.get("word"),
-                    language=language,
-                    strongs_number=strongs_num,
-                    transliteration=transliteration,
-                    morphology=word_data.get("morphology"),
-                    definition=definition,
-                    word_order=word_data.get("word_order", 0),
-                )
-
-                batch.append(original_word)
-                total_words += 1
-
-                # Commit in batches
-                if len(batch) >= batch_size:
-                    self.db.add_all(batch)
-                    self.db.commit()
-                    batch = []
+                            transliteration = strongs_data.translit
+
+                    append({
+                        "verse_id": verse_id,
+                        "word": get("word"),
+                        "language": language,
+                        "strongs_number": strongs_num,
+                        "transliteration": transliteration,
+                        "morphology": get("morphology"),
+                        "definition": definition,
+                        "word_order": get("word_order", 0),
+                    })
+                    total_words += 1
+
+                    # Commit in batches
+                    if len(batch) >= batch_size:
+                        write_batch(batch)
+                        commit()
+                        batch.clear()
 
         # Commit remaining words
         if batch:
-            self.db.add_all(batch)
-            self.db.commit()
+            write_batch(batch)
+            commit()
 
-        logger.info(f"✅ Created {total_words} Hebrew/Aramaic words")
+        logger.info("✅ Created %s Hebrew/Aramaic words", total_words)
         return total_words
 
     def add_sample_original_words(self) -> int:
@@ -633,51 +1189,52 @@ class OriginalLanguageManager:
             },
         ]
 
-        created_count = 0
-
-        for entry in sample_data:
-            # Find the verse
-            book_query = select(Book).where(Book.name == entry["book"])
-            book = self.db.execute(book_query).scalar_one_or_none()
-
-            if not book:
-                logger.warning(f"Book not found: {entry['book']}")
-                continue
+        rows = []
+        verse_ids = self._resolve_verse_ids(
+            Book.name, ((e["book"], e["chapter"], e["verse"]) for e in sample_data)
+        )
 
-            verse_query = (
-                select(Verse)
-                .where(
-                    and_(
-                        Verse.book_id == book.id,
-                        Verse.chapter == entry["chapter"],
-                        Verse.verse == entry["verse"],
-                    )
-                )
-                .limit(1)
-            )
+        strongs_entries = self._resolve_many(
+            (w["strongs"], e["language"]) for e in sample_data for w in e["words"]
+        )
 
-            verse = self.db.execute(verse_query).scalar_one_or_none()
+        for entry in sample_data:
+            verse_id = verse_ids.get((entry["book"], entry["chapter"], entry["verse"]))
 
-            if not verse:
+            if not verse_id:
                 logger.warning(
-                    f"Verse not found: {entry['book']} {entry['chapter']}:{entry['verse']}"
+                    "Verse not found: %s %s:%s", entry["book"], entry["chapter"], entry["verse"]
                 )
                 continue
 
-            # Add each word
+            # Collect each word as a row, enriched with Strong's data
             for word_data in entry["words"]:
-                self.create_original_word(
-                    verse=verse,
-                    word=word_data["word"],
-                    language=entry["language"],
-                    strongs_number=word_data["strongs"],
-                    transliteration=word_data.get("translit"),
-                    word_order=word_data.get("order"),
+                definition = None
+                transliteration = word_data.get("translit")
+                strongs_data = strongs_entries.get((word_data["strongs"], entry["language"]))
+                if strongs_data:
+                    definition = strongs_data.definition
+                    if not transliteration:
+                        transliteration = strongs_data.translit
+
+                rows.append(
+                    {
+                        "verse_id": verse_id,
+                        "word": word_data["word"],
+                        "language": entry["language"],
+                        "strongs_number": word_data["strongs"],
+                        "transliteration": transliteration,
+                        "morphology": None,
+                        "definition": definition,
+                        "word_order": word_data.get("order"),
+                    }
                 )
-                created_count += 1
 
+        created_ids = self._insert_original_words(rows)
         self.db.commit()
-        logger.info(f"Created {created_count} sample original language words")
+
+        created_count = len(created_ids)
+        logger.info("Created %s sample original language words", created_count)
         return created_count
 
     def get_original_words(self, verse_id: UUID) -> List[Dict]:
@@ -689,28 +1246,22 @@ class OriginalLanguageManager:
         Returns:
             List of original word dictionaries.
         """
-        words = (
-            self.db.query(OriginalWord)
-            .filter(OriginalWord.verse_id == verse_id)
+        # Select plain columns so rows are not hydrated into ORM objects
+        stmt = (
+            select(
+                OriginalWord.word,
+                OriginalWord.language,
+                OriginalWord.strongs_number,
+                OriginalWord.transliteration,
+                OriginalWord.morphology,
+                OriginalWord.definition,
+                OriginalWord.word_order,
+            )
+            .where(OriginalWord.verse_id == verse_id)
             .order_by(OriginalWord.word_order)
-            .all()
         )
 
-        results = []
-        for word in words:
-            results.append(
-                {
-                    "word": word.word,
-                    "language": word.language,
-                    "strongs_number": word.strongs_number,
-                    "transliteration": word.transliteration,
-                    "morphology": word.morphology,
-                    "definition": word.definition,
-                    "word_order": word.word_order,
-                }
-            )
-
-        return results
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
 
     def get_verses_with_strongs(self, strongs_number: str) -> List[Dict]:
         """Find all verses containing a specific Strong's number.
@@ -721,63 +1272,68 @@ class OriginalLanguageManager:
         Returns:
             List of verse dictionaries.
         """
-        words = (
-            self.db.query(OriginalWord)
-            .filter(OriginalWord.strongs_number == strongs_number)
-            .all()
+        # Project just the returned columns so rows are not hydrated into ORM objects
+        stmt = (
+            select(
+                Verse.id.label("verse_id"),
+                Book.name.label("book"),
+                Book.name_korean.label("book_korean"),
+                Verse.chapter,
+                Verse.verse,
+                Verse.text,
+                OriginalWord.word,
+                OriginalWord.transliteration,
+            )
+            .select_from(OriginalWord)
+            .join(Verse, OriginalWord.verse_id == Verse.id)
+            .join(Book, Verse.book_id == Book.id)
+            .where(OriginalWord.strongs_number == strongs_number)
         )
 
-        results = []
-        seen_verses = set()
-
-        for word in words:
-            if word.verse_id in seen_verses:
-                continue
-
-            verse = word.verse
-            results.append(
-                {
-                    "verse_id": str(verse.id),
-                    "book": verse.book.name,
-                    "book_korean": verse.book.name_korean,
-                    "chapter": verse.chapter,
-                    "verse": verse.verse,
-                    "text": verse.text,
-                    "word": word.word,
-                    "transliteration": word.transliteration,
-                }
+        # Keep only the first occurrence per verse in SQL rather than filtering in Python
+        if self.db.get_bind().dialect.name == "postgresql":
+            stmt = stmt.distinct(OriginalWord.verse_id).order_by(
+                OriginalWord.verse_id, OriginalWord.word_order
+            )
+        else:
+            first_words = (
+                select(
+                    OriginalWord.id,
+                    func.row_number()
+                    .over(partition_by=OriginalWord.verse_id, order_by=OriginalWord.word_order)
+                    .label("occurrence"),
+                )
+                .where(OriginalWord.strongs_number == strongs_number)
+                .subquery()
+            )
+            stmt = stmt.join(first_words, OriginalWord.id == first_words.c.id).where(
+                first_words.c.occurrence == 1
             )
-            seen_verses.add(word.verse_id)
 
-        return results
+        return [
+            {**row, "verse_id": str(row["verse_id"])}
+            for row in self.db.execute(stmt).mappings()
+        ]
 
 
 async def main():
     """Main function for populating original language data."""
-    import asyncio
-
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
-    manager = OriginalLanguageManager()
-
-    try:
-        logger.info("Fetching Strong's concordance data...")
-        await manager.fetch_strongs_data()
-
-        logger.info("Adding sample original language words...")
-        count = manager.add_sample_original_words()
+    with OriginalLanguageManager() as manager:
+        try:
+            logger.info("Fetching Strong's concordance data...")
+            await manager.fetch_strongs_data()
 
-        logger.info(f"Successfully created {count} original language words!")
-    except Exception as e:
-        logger.error(f"Error populating original language data: {e}")
-        raise
-    finally:
-        manager.db.close()
+            logger.info("Adding sample original language words...")
+            count = manager.add_sample_original_words()
 
+            logger.info("Successfully created %s original language words!", count)
+        except Exception as e:
+            logger.error("Error populating original language data: %s", e)
+            raise
 
 if __name__ == "__main__":
-    import asyncio
-
     asyncio.run(main())
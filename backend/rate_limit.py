@@ -0,0 +1,134 @@
+"""Per-provider rate limiting for LLM API calls.
+
+Limits are shared across workers through a Redis sliding-window counter,
+with an in-process token bucket as the fallback when Redis is unavailable.
+All limiter state lives in this module so there is exactly one copy of it.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+
+import redis
+
+from cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# In-process rate limiting state (token bucket per provider), used when
+# Redis is unavailable
+_rate_limit_state = {
+    "gemini": {"tokens": None, "last_refill": 0.0},
+    "groq": {"tokens": None, "last_refill": 0.0},
+}
+# One lock per provider so Gemini and Groq checks never contend; the
+# read-refill-deduct sequence must be atomic across threadpool workers
+_rate_limit_locks: defaultdict[str, threading.Lock] = defaultdict(
+    threading.Lock, {provider: threading.Lock() for provider in _rate_limit_state}
+)
+
+
+def check_local_rate_limit(provider: str, limit: int) -> bool:
+    """Check the in-process rate limit for a provider.
+
+    Uses a token bucket holding up to ``limit`` tokens that refills at
+    ``limit / 60`` tokens per second, so traffic is smoothed instead of
+    bursting across fixed one-minute window boundaries.
+
+    Args:
+        provider: 'gemini' or 'groq'
+        limit: Requests per minute limit
+
+    Returns:
+        True if within limits, False if rate limited
+    """
+    current_time = time.monotonic()
+
+    with _rate_limit_locks[provider]:
+        state = _rate_limit_state[provider]
+
+        if state["tokens"] is None:
+            # First call: start with a full bucket
+            state["tokens"] = float(limit)
+        else:
+            elapsed = current_time - state["last_refill"]
+            state["tokens"] = min(float(limit), state["tokens"] + elapsed * (limit / 60.0))
+        state["last_refill"] = current_time
+
+        if state["tokens"] < 1.0:
+            logger.warning("%s rate limit exceeded (%d RPM)", provider.capitalize(), limit)
+            return False
+
+        state["tokens"] -= 1.0
+        return True
+
+
+class SlidingWindowLimiter:
+    """Sliding-window RPM limiter shared across workers through Redis.
+
+    Keeps one counter per provider per window bucket and estimates the
+    rolling request count as ``previous * (1 - elapsed_fraction) + current``,
+    so every uvicorn worker and replica draws from the same provider quota.
+    """
+
+    def __init__(self, window_seconds: int = 60):
+        self.window_seconds = window_seconds
+
+    def allow(self, provider: str, limit: int) -> bool:
+        """Record a request for a provider if it fits within the limit.
+
+        Falls back to the in-process token bucket when Redis is unavailable.
+
+        Args:
+            provider: 'gemini' or 'groq'
+            limit: Requests per minute limit
+
+        Returns:
+            True if within limits, False if rate limited
+        """
+        try:
+            return self._allow_redis(provider, limit)
+        except (redis.ConnectionError, redis.TimeoutError):
+            return check_local_rate_limit(provider, limit)
+
+    def _allow_redis(self, provider: str, limit: int) -> bool:
+        now = time.time()
+        bucket = int(now // self.window_seconds)
+        current_key = f"ratelimit:{provider}:{bucket}"
+        previous_key = f"ratelimit:{provider}:{bucket - 1}"
+
+        client = get_cache().client
+        pipe = client.pipeline()
+        pipe.incr(current_key)
+        pipe.expire(current_key, self.window_seconds * 2)
+        pipe.get(previous_key)
+        current, _, previous = pipe.execute()
+
+        elapsed_fraction = (now % self.window_seconds) / self.window_seconds
+        # Count of requests before this one, weighted across both windows
+        estimated = int(previous or 0) * (1 - elapsed_fraction) + int(current) - 1
+
+        if estimated >= limit:
+            # Don't let rejected requests consume quota
+            client.decr(current_key)
+            logger.warning("%s rate limit exceeded (%d RPM)", provider.capitalize(), limit)
+            return False
+
+        return True
+
+
+_rate_limiter = SlidingWindowLimiter()
+
+
+def check_rate_limit(provider: str, limit: int) -> bool:
+    """Check if we're within rate limits for a provider.
+
+    Args:
+        provider: 'gemini' or 'groq'
+        limit: Requests per minute limit
+
+    Returns:
+        True if within limits, False if rate limited
+    """
+    return _rate_limiter.allow(provider, limit)
@@ -5,6 +5,12 @@ pairs, providing fine-grained relevance scoring after initial retrieval.
 """
 
 import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
 
 from config import get_settings
 
@@ -14,18 +20,194 @@ logger = logging.getLogger(__name__)
 _reranker = None
 
 
+def _configure_threads() -> None:
+    """Size torch's CPU thread pools for this worker before the model is loaded.
+
+    Cores are split across Uvicorn workers so their intra-op pools do not
+    oversubscribe the CPU. Tokenizer parallelism is disabled to avoid
+    contention with the server's own processes.
+    """
+    import torch
+
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+    threads = max(1, min(8, (os.cpu_count() or 1) // max(1, settings.workers)))
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before torch runs any parallel work
+        logger.debug("torch inter-op threads already initialized")
+
+    logger.info(
+        "Reranker threads: intra-op=%s, inter-op=%s",
+        torch.get_num_threads(),
+        torch.get_num_interop_threads(),
+    )
+
+
+def _load_cross_encoder():
+    """Load the cross-encoder on the configured inference backend.
+
+    The torch backend runs on CUDA when available, in FP16 if
+    ``reranker_fp16`` is set. For ONNX, the quantized weights published with
+    the model are tried first. If they are missing, the model is exported
+    once and saved under ``reranker_export_dir`` so later workers load the
+    export instead of converting again.
+    """
+    from sentence_transformers import CrossEncoder
+
+    backend = settings.reranker_backend
+    if backend == "torch":
+        import torch
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model = CrossEncoder(settings.reranker_model, max_length=512, device=device)
+        if device == "cuda" and settings.reranker_fp16:
+            # Half precision engages tensor cores; the CPU path stays FP32
+            model.model.half()
+            logger.info("Reranker running on CUDA in fp16")
+        return model
+
+    export_dir = (
+        Path(settings.reranker_export_dir).expanduser()
+        / f"{settings.reranker_model.replace('/', '--')}-{backend}"
+    )
+    if export_dir.exists():
+        logger.info("Loading exported %s reranker from %s", backend, export_dir)
+        return CrossEncoder(str(export_dir), max_length=512, backend=backend)
+
+    if backend == "onnx":
+        try:
+            return CrossEncoder(
+                settings.reranker_model,
+                max_length=512,
+                backend=backend,
+                model_kwargs={"file_name": settings.reranker_onnx_file},
+            )
+        except Exception as e:
+            logger.warning(
+                "%s unavailable (%s), exporting FP32 ONNX model", settings.reranker_onnx_file, e
+            )
+
+    model = CrossEncoder(settings.reranker_model, max_length=512, backend=backend)
+    # Save beside the final path and rename it into place, so other workers
+    # never load a half-written export
+    export_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix=f".{export_dir.name}-", dir=export_dir.parent)
+    try:
+        model.save_pretrained(tmp_dir)
+        try:
+            os.replace(tmp_dir, export_dir)
+        except OSError:
+            # Another worker moved its export into place first
+            pass
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return model
+
+
 def _get_reranker():
     """Load cross-encoder model (lazy, cached singleton)."""
     global _reranker
     if _reranker is None:
-        from sentence_transformers import CrossEncoder
-
-        logger.info(f"Loading reranker model: {settings.reranker_model}")
-        _reranker = CrossEncoder(settings.reranker_model, max_length=512)
+        logger.info(
+            "Loading reranker model: %s (%s)", settings.reranker_model, settings.reranker_backend
+        )
+        _configure_threads()
+        _reranker = _load_cross_encoder()
         logger.info("Reranker model loaded successfully")
     return _reranker
 
 
+def warmup_reranker() -> None:
+    """Load the cross-encoder and run one prediction.
+
+    The dummy pair triggers the backend's lazy initialization, so the first
+    search doesn't pay for model loading.
+    """
+    _get_reranker().predict([("warm", "up text")], batch_size=1, show_progress_bar=False)
+
+
+def score_pairs(pairs: list[tuple[str, str]]) -> np.ndarray:
+    """Score (query, passage) pairs with the cross-encoder.
+
+    Passages are truncated to ``reranker_char_cap`` and scored shortest first,
+    so each batch pads to similar lengths.
+
+    Args:
+        pairs: (query, passage text) pairs; may mix several queries
+
+    Returns:
+        Relevance score per pair, in input order
+    """
+    if not pairs:
+        return np.empty(0, dtype=np.float32)
+
+    reranker = _get_reranker()
+
+    # Order by the capped length, since that is what actually gets tokenized
+    char_cap = settings.reranker_char_cap
+    lengths = np.fromiter(
+        (min(len(text), char_cap) for _, text in pairs), dtype=np.intp, count=len(pairs)
+    )
+    order = np.argsort(lengths, kind="stable")
+    predicted = np.asarray(reranker.predict(
+        [(pairs[i][0], pairs[i][1][:char_cap]) for i in order],
+        batch_size=settings.reranker_batch_size,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    ))
+
+    # Scatter back from length order to input order in one assignment
+    scores = np.empty_like(predicted)
+    scores[order] = predicted
+    return scores
+
+
+def apply_scores(candidates: list[dict], scores: np.ndarray, top_k: int) -> list[dict]:
+    """Attach rerank scores to the best top_k candidates.
+
+    Only the top_k are selected (argpartition) and sorted, instead of sorting
+    every candidate. Returned dicts are copies carrying a ``rerank_score``.
+
+    Args:
+        candidates: Candidate dicts, in the order they were scored
+        scores: Score per candidate
+        top_k: Number of results to return
+
+    Returns:
+        Top-k candidates reordered by score
+    """
+    negated = -np.asarray(scores)
+    if 0 < top_k < len(negated):
+        # Sorting the selected indices first keeps ties in input order
+        top = np.sort(np.argpartition(negated, top_k - 1)[:top_k])
+        top = top[np.argsort(negated[top], kind="stable")]
+    else:
+        top = np.argsort(negated, kind="stable")[:max(top_k, 0)]
+
+    return [dict(candidates[i], rerank_score=float(-negated[i])) for i in top]
+
+
+def skip_scoring(candidates: list[dict], top_k: int) -> bool:
+    """Check whether reranking can return the candidates without the model.
+
+    When every candidate already fits in the top_k, scoring cannot change
+    which ones are returned, so the forward pass is skipped unless
+    ``reranker_always_score`` asks for cross-encoder scores regardless.
+    Skipped candidates keep their order and get no ``rerank_score``.
+
+    Args:
+        candidates: Candidate dicts to rerank
+        top_k: Number of results to return
+
+    Returns:
+        True if the candidates should be returned as-is
+    """
+    return not candidates or (len(candidates) <= top_k and not settings.reranker_always_score)
+
+
 def rerank(query: str, candidates: list[dict], top_k: int) -> list[dict]:
     """Rerank candidates using cross-encoder.
 
@@ -37,14 +219,8 @@ def rerank(query: str, candidates: list[dict], top_k: int) -> list[dict]:
     Returns:
         Top-k candidates reordered by cross-encoder score
     """
-    if not candidates:
+    if skip_scoring(candidates, top_k):
         return candidates
 
-    reranker = _get_reranker()
-    pairs = [(query, c["text"]) for c in candidates]
-    scores = reranker.predict(pairs)
-
-    for i, c in enumerate(candidates):
-        c["rerank_score"] = float(scores[i])
-
-    return sorted(candidates, key=lambda x: x["rerank_score"], reverse=True)[:top_k]
+    scores = score_pairs([(query, c["text"]) for c in candidates])
+    return apply_scores(candidates, scores, top_k)
@@ -0,0 +1,159 @@
+"""Dynamic batching of cross-encoder reranking across concurrent searches.
+
+Rerank calls arriving within a short window are flattened into a single
+cross-encoder predict call, so the model runs full batches instead of one
+small batch per search.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from config import get_settings
+from reranker import apply_scores, rerank, score_pairs, skip_scoring
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RerankRequest:
+    """A single search's candidates waiting to be reranked."""
+
+    query: str
+    candidates: list[dict]
+    top_k: int
+    future: asyncio.Future = None
+
+    def __post_init__(self):
+        if self.future is None:
+            self.future = asyncio.get_running_loop().create_future()
+
+
+class RerankBatcher:
+    """Coalesces concurrent rerank requests into shared model calls."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue[RerankRequest] = asyncio.Queue()
+        self._background_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background batch processor."""
+        if self._background_task is None or self._background_task.done():
+            self._background_task = asyncio.create_task(self._process_batches())
+
+    async def stop(self):
+        """Stop the background batch processor."""
+        if self._background_task:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, query: str, candidates: list[dict], top_k: int) -> list[dict]:
+        """Queue candidates for the next batch and wait for their reranked order.
+
+        Args:
+            query: Search query
+            candidates: List of dicts with at minimum a "text" field
+            top_k: Number of results to return
+
+        Returns:
+            Top-k candidates reordered by cross-encoder score
+        """
+        request = RerankRequest(query=query, candidates=candidates, top_k=top_k)
+        await self.queue.put(request)
+        return await request.future
+
+    async def _process_batches(self):
+        """Background task that scores batches as requests arrive."""
+        while True:
+            try:
+                batch = await self._collect_batch()
+                await self._process_batch(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("Error in rerank batch processor: %s", e)
+
+    async def _collect_batch(self) -> list[RerankRequest]:
+        """Wait for a request, then gather peers arriving within the batch window."""
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + settings.rerank_batch_wait_ms / 1000.0
+
+        while len(batch) < settings.rerank_batch_max:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _process_batch(self, batch: list[RerankRequest]):
+        """Score every request's candidates in one model call and resolve each future.
+
+        Args:
+            batch: RerankRequest objects to score together
+        """
+        pairs = [(req.query, c["text"]) for req in batch for c in req.candidates]
+
+        try:
+            # predict is CPU-bound, so keep it off the event loop
+            scores = await asyncio.to_thread(score_pairs, pairs)
+        except Exception as e:
+            logger.error("Rerank batch of %d failed: %s", len(batch), e)
+            for req in batch:
+                if not req.future.done():
+                    req.future.set_exception(e)
+            return
+
+        logger.debug("Reranked %d searches (%d pairs) in one batch", len(batch), len(pairs))
+
+        start = 0
+        for req in batch:
+            end = start + len(req.candidates)
+            if not req.future.done():
+                req.future.set_result(apply_scores(req.candidates, scores[start:end], req.top_k))
+            start = end
+
+
+# Global batcher instance
+_batcher: Optional[RerankBatcher] = None
+
+
+def get_rerank_batcher() -> RerankBatcher:
+    """Get the global rerank batcher instance."""
+    global _batcher
+    if _batcher is None:
+        _batcher = RerankBatcher()
+    return _batcher
+
+
+async def rerank_async(query: str, candidates: list[dict], top_k: int) -> list[dict]:
+    """Rerank candidates without blocking the event loop.
+
+    Uses the shared batcher when ``enable_rerank_batching`` is set, otherwise
+    scores this request alone in a worker thread.
+
+    Args:
+        query: Search query
+        candidates: List of dicts with at minimum a "text" field
+        top_k: Number of results to return
+
+    Returns:
+        Top-k candidates reordered by cross-encoder score
+    """
+    if skip_scoring(candidates, top_k):
+        return candidates
+
+    if not settings.enable_rerank_batching:
+        return await asyncio.to_thread(rerank, query, candidates, top_k)
+
+    batcher = get_rerank_batcher()
+    await batcher.start()
+    return await batcher.submit(query, candidates, top_k)
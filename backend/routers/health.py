@@ -1,5 +1,7 @@
 """Health check API router."""
 
+import asyncio
+import json
 from datetime import datetime
 
 from fastapi import APIRouter, Depends
@@ -14,6 +16,82 @@ from schemas import HealthResponse
 router = APIRouter(tags=["health"])
 settings = get_settings()
 
+# Tables reported in health stats, keyed by stat name
+_STATS_TABLES = {
+    "total_verses": Verse,
+    "total_translations": Translation,
+    "total_embeddings": Embedding,
+}
+
+
+async def _exact_count(db: AsyncSession, model) -> int:
+    """Count a table's rows on a session of its own.
+
+    A session runs one statement at a time, so concurrent counts each need
+    their own connection from the pool.
+
+    Args:
+        db: Request session whose engine the count runs on
+        model: ORM model of the table to count
+
+    Returns:
+        Exact row count
+    """
+    async with AsyncSession(db.bind) as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+async def _count_rows(db: AsyncSession) -> dict[str, int]:
+    """Count rows in the reported tables.
+
+    On PostgreSQL the planner's ``pg_class.reltuples`` estimates are read in a
+    single catalog lookup instead of scanning each table. Tables that have
+    never been analyzed (negative estimate) fall back to exact counts, which
+    run concurrently on separate connections.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Row count per stat name
+    """
+    stats = {}
+    if db.get_bind().dialect.name == "postgresql":
+        rows = await db.execute(
+            text("SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(:names)"),
+            {"names": [model.__tablename__ for model in _STATS_TABLES.values()]},
+        )
+        estimates = {relname: count for relname, count in rows if count >= 0}
+
+        missing = {}
+        for name, model in _STATS_TABLES.items():
+            if model.__tablename__ in estimates:
+                stats[name] = estimates[model.__tablename__]
+            else:
+                missing[name] = model
+        counts = await asyncio.gather(*(_exact_count(db, model) for model in missing.values()))
+        stats.update(zip(missing, counts))
+    else:
+        for name, model in _STATS_TABLES.items():
+            stats[name] = (await db.execute(select(func.count()).select_from(model))).scalar()
+
+    return stats
+
+
+@router.get("/health/live", response_model=HealthResponse)
+async def liveness_check():
+    """Liveness probe.
+
+    Reports that the process is serving requests without touching the
+    database, Redis or models.
+    """
+    return HealthResponse(
+        status="healthy",
+        timestamp=datetime.utcnow(),
+        version="1.0.0",
+        services={"api": "healthy"},
+    )
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check(db: AsyncSession = Depends(get_db)):
@@ -25,22 +103,26 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     errors = []
     stats = {}
 
+    cache = get_cache()
+
     # Check database
     try:
         await db.execute(text("SELECT 1"))
         services["database"] = "healthy"
 
-        # Get stats
-        stats["total_verses"] = (await db.execute(select(func.count()).select_from(Verse))).scalar()
-        stats["total_translations"] = (await db.execute(select(func.count()).select_from(Translation))).scalar()
-        stats["total_embeddings"] = (await db.execute(select(func.count()).select_from(Embedding))).scalar()
+        # Get stats, reusing recent counts so frequent probes don't rescan tables
+        cached_stats = cache.get_cached_metadata("health:stats")
+        if cached_stats:
+            stats.update(json.loads(cached_stats))
+        else:
+            stats.update(await _count_rows(db))
+            cache.cache_metadata("health:stats", json.dumps(stats), ttl=settings.health_stats_ttl)
     except Exception as e:
         services["database"] = "unhealthy"
         errors.append(f"Database error: {str(e)}")
 
     # Check Redis
     try:
-        cache = get_cache()
         if cache.is_connected():
             services["redis"] = "healthy"
             cache_stats = cache.get_cache_stats()
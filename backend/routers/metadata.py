@@ -1,15 +1,19 @@
 """Metadata API router for translations and books."""
 
+import time
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import CacheClient, get_cache
+from config import get_settings
 from database import Book, Translation, Verse, get_db
 from schemas import BookInfo, BooksResponse, TranslationInfo, TranslationsResponse
 
 router = APIRouter(prefix="/api", tags=["metadata"])
+settings = get_settings()
 
 # Language name mapping
 LANGUAGE_NAMES = {
@@ -19,6 +23,9 @@ LANGUAGE_NAMES = {
     "gr": "Greek",
 }
 
+# Serialized book listings held in-process: cache key -> (body, expires_at)
+_books_bodies: dict[str, tuple[str, float]] = {}
+
 
 @router.get("/translations", response_model=TranslationsResponse)
 async def list_translations(
@@ -27,45 +34,55 @@ async def list_translations(
         description="Filter by language code (en, ko, he, gr)",
     ),
     db: AsyncSession = Depends(get_db),
+    cache: CacheClient = Depends(get_cache),
 ):
     """List all available Bible translations.
 
     Returns metadata for all translations, optionally filtered by language.
+    Listings only change on ingestion, so the serialized response is cached.
     """
-    query = select(Translation)
+    cache_key = f"translations:{language or ''}"
+    cached = cache.get_cached_metadata(cache_key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+
+    # Count verses in the same statement; the outer join keeps empty translations.
+    # Plain columns skip building ORM entities and identity-map bookkeeping.
+    query = (
+        select(
+            Translation.id,
+            Translation.name,
+            Translation.abbreviation,
+            Translation.language_code,
+            Translation.description,
+            Translation.is_original_language,
+            func.count(Verse.id).label("verse_count"),
+        )
+        .outerjoin(Verse, Verse.translation_id == Translation.id)
+        .group_by(Translation.id)
+    )
 
     if language:
         query = query.where(Translation.language_code == language)
 
-    translations = (await db.execute(query.order_by(Translation.language_code, Translation.name))).scalars().all()
+    rows = (await db.execute(query.order_by(Translation.language_code, Translation.name))).mappings()
 
-    # Get verse counts for each translation
-    verse_counts = dict(
-        (await db.execute(
-            select(Verse.translation_id, func.count(Verse.id))
-            .group_by(Verse.translation_id)
-        )).all()
-    )
-
-    result = []
-    for trans in translations:
-        result.append(
-            TranslationInfo(
-                id=trans.id,
-                name=trans.name,
-                abbreviation=trans.abbreviation,
-                language_code=trans.language_code,
-                language_name=LANGUAGE_NAMES.get(trans.language_code, trans.language_code),
-                description=trans.description,
-                is_original_language=trans.is_original_language,
-                verse_count=verse_counts.get(trans.id, 0),
-            )
+    # Rows come straight from our own schema, so skip re-validating them
+    language_name = LANGUAGE_NAMES.get
+    result = [
+        TranslationInfo.model_construct(
+            **row,
+            language_name=language_name(row["language_code"], row["language_code"]),
         )
+        for row in rows
+    ]
 
-    return TranslationsResponse(
+    body = TranslationsResponse.model_construct(
         translations=result,
         total_count=len(result),
-    )
+    ).model_dump_json()
+    cache.cache_metadata(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/books", response_model=BooksResponse)
@@ -80,13 +97,48 @@ async def list_books(
         description="Filter by genre",
     ),
     db: AsyncSession = Depends(get_db),
+    cache: CacheClient = Depends(get_cache),
 ):
     """List all Bible books with metadata.
 
     Returns metadata for all 66 books, optionally filtered by
-    testament or genre.
+    testament or genre. The serialized response is cached until the next
+    ingestion. The 66 books never change at runtime, so each worker also
+    keeps the body in memory for ``books_local_ttl`` seconds, which bounds
+    how long it serves a listing from before a re-ingestion.
     """
-    query = select(Book)
+    cache_key = f"books:{testament or ''}:{genre or ''}"
+    current_time = time.monotonic()
+
+    entry = _books_bodies.get(cache_key)
+    if entry is not None and entry[1] > current_time:
+        return Response(content=entry[0], media_type="application/json")
+
+    cached = cache.get_cached_metadata(cache_key)
+    if cached:
+        _books_bodies[cache_key] = (cached, current_time + settings.books_local_ttl)
+        return Response(content=cached, media_type="application/json")
+
+    # Count each book's verses in the first translation within the same statement
+    first_translation_id = select(Translation.id).limit(1).scalar_subquery()
+    query = (
+        select(
+            Book.id,
+            Book.name,
+            Book.name_korean,
+            Book.abbreviation,
+            Book.testament,
+            Book.genre,
+            Book.book_number,
+            Book.total_chapters,
+            func.count(Verse.id).label("total_verses"),
+        )
+        .outerjoin(
+            Verse,
+            (Verse.book_id == Book.id) & (Verse.translation_id == first_translation_id),
+        )
+        .group_by(Book.id)
+    )
 
     if testament:
         query = query.where(Book.testament == testament)
@@ -94,38 +146,15 @@ async def list_books(
     if genre:
         query = query.where(Book.genre == genre)
 
-    books = (await db.execute(query.order_by(Book.book_number))).scalars().all()
+    rows = (await db.execute(query.order_by(Book.book_number))).mappings()
 
-    # Get verse counts for each book (using first translation)
-    first_translation = (await db.execute(select(Translation).limit(1))).scalar_one_or_none()
-    verse_counts = {}
-
-    if first_translation:
-        verse_counts = dict(
-            (await db.execute(
-                select(Verse.book_id, func.count(Verse.id))
-                .where(Verse.translation_id == first_translation.id)
-                .group_by(Verse.book_id)
-            )).all()
-        )
+    # Rows come straight from our own schema, so skip re-validating them
+    result = [BookInfo.model_construct(**row) for row in rows]
 
-    result = []
-    for book in books:
-        result.append(
-            BookInfo(
-                id=book.id,
-                name=book.name,
-                name_korean=book.name_korean,
-                abbreviation=book.abbreviation,
-                testament=book.testament,
-                genre=book.genre,
-                book_number=book.book_number,
-                total_chapters=book.total_chapters,
-                total_verses=verse_counts.get(book.id, 0),
-            )
-        )
-
-    return BooksResponse(
+    body = BooksResponse.model_construct(
         books=result,
         total_count=len(result),
-    )
+    ).model_dump_json()
+    cache.cache_metadata(cache_key, body)
+    _books_bodies[cache_key] = (body, current_time + settings.books_local_ttl)
+    return Response(content=body, media_type="application/json")
@@ -1,5 +1,6 @@
 """Search API router."""
 
+import json
 import logging
 from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,29 @@ router = APIRouter(prefix="/api", tags=["search"])
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# orjson is optional - serializes each streamed NDJSON line in C instead of pure Python
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_NEWLINE = b"\n"
+
+
+def _ndjson_line(message: dict) -> bytes:
+    """Serialize a message as one UTF-8 NDJSON line.
+
+    Args:
+        message: JSON-serializable message
+
+    Returns:
+        Encoded JSON followed by a newline
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY) + _NEWLINE
+    return json.dumps(message).encode() + _NEWLINE
+
 
 @router.post("/search")
 async def semantic_search(
@@ -27,7 +51,6 @@ async def semantic_search(
 
     Streams results and then AI response chunks using NDJSON.
     """
-    import json
     from fastapi.responses import StreamingResponse
     from llm import generate_contextual_response_stream
 
@@ -43,12 +66,14 @@ async def semantic_search(
                 }
                 filters = {k: v for k, v in filters.items() if v is not None}
 
+            language = detect_language(request.query)
+
             # Query expansion: generate alternative search queries
             expanded_queries = []
             if settings.enable_query_expansion:
                 expanded_queries = await expand_query(
                     query=request.query,
-                    language=detect_language(request.query),
+                    language=language,
                     groq_api_key=x_groq_api_key,
                     gemini_api_key=x_gemini_api_key,
                 )
@@ -75,12 +100,10 @@ async def semantic_search(
                     "search_metadata": results["search_metadata"],
                 }
             }
-            yield json.dumps(search_response) + "\n"
+            yield _ndjson_line(search_response)
 
-            # Detect language and generate AI response stream
+            # Generate AI response stream
             if results.get("results"):
-                language = detect_language(request.query)
-                
                 # Build conversation history dicts from request
                 history = None
                 if request.conversation_history:
@@ -99,14 +122,19 @@ async def semantic_search(
                     conversation_history=history,
                 ):
                     if token:
-                        msg = {"type": "token", "content": token}
-                        yield json.dumps(msg) + "\n"
+                        yield _ndjson_line({"type": "token", "content": token})
             
             # Send done signal (optional but helpful)
-            # yield json.dumps({"type": "done"}) + "\n"
+            # yield _ndjson_line({"type": "done"})
 
         except Exception as e:
             logger.error(f"Search error: {e}", exc_info=True)
-            yield json.dumps({"type": "error", "message": str(e)}) + "\n"
+            yield _ndjson_line({"type": "error", "message": str(e)})
 
-    return StreamingResponse(response_generator(), media_type="application/x-ndjson")
+    # Disable caching and proxy buffering so each token reaches the client
+    # as soon as it is generated
+    return StreamingResponse(
+        response_generator(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -37,14 +37,15 @@ async def thematic_search(
             api_key=x_gemini_api_key,
         )
 
-        return ThemeResponse(
-            theme=results.get("theme", request.theme),
-            testament_filter=results.get("testament_filter"),
-            query_time_ms=results["query_time_ms"],
-            results=results["results"],
-            total_results=results["search_metadata"]["total_results"],
-            related_themes=None,  # Could be enhanced with theme extraction
-        )
+        # Returned as a dict so response_model validates the results only once
+        return {
+            "theme": results.get("theme", request.theme),
+            "testament_filter": results.get("testament_filter"),
+            "query_time_ms": results["query_time_ms"],
+            "results": results["results"],
+            "total_results": results["search_metadata"]["total_results"],
+            "related_themes": None,  # Could be enhanced with theme extraction
+        }
 
     except Exception as e:
         raise HTTPException(
@@ -76,7 +76,9 @@ async def get_verse(
             },
         )
 
-    return VerseDetailResponse(**result)
+    # response_model validates and serializes the dict once; building the
+    # model here as well would validate it twice
+    return result
 
 
 @router.get("/chapter/{book}/{chapter}")
@@ -24,6 +24,16 @@ from tqdm import tqdm
 
 from data.books_metadata import BOOKS_METADATA
 
+# Section headers like <천지 창조> embedded in verse text
+_SECTION_HEADER_RE = re.compile(r'<[^>]+>\s*')
+
+# Individual value tuples of a bible2 INSERT statement
+# Pattern: (idx, cate, book, chapter, paragraph, 'sentence', 'testament', 'long_label', 'short_label')
+# Note: sentence can contain single quotes (escaped as '')
+_VALUE_TUPLE_RE = re.compile(
+    r"\((\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*'([^']*(?:''[^']*)*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)'\)"
+)
+
 
 def fetch_nkrv_from_mysql_dump(sql_file_path: str) -> list[dict]:
     """Parse 개역개정 from MySQL dump file.
@@ -64,12 +74,7 @@ def fetch_nkrv_from_mysql_dump(sql_file_path: str) -> list[dict]:
         all_tuples = []
         for match_block in matches:
             # Split individual value tuples
-            # Pattern: (idx, cate, book, chapter, paragraph, 'sentence', 'testament', 'long_label', 'short_label')
-            # Note: sentence can contain single quotes (escaped as '')
-            tuple_pattern = r"\((\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*'([^']*(?:''[^']*)*)',\s*'([^']*)',\s*'([^']*)',\s*'([^']*)'\)"
-
-            tuples = re.findall(tuple_pattern, match_block)
-            all_tuples.extend(tuples)
+            all_tuples.extend(_VALUE_TUPLE_RE.findall(match_block))
 
         print(f"Found {len(all_tuples)} total verses to parse")
 
@@ -93,7 +98,7 @@ def fetch_nkrv_from_mysql_dump(sql_file_path: str) -> list[dict]:
                     continue
 
                 # Clean text: remove section headers like <천지 창조>
-                text = re.sub(r'<[^>]+>\s*', '', sentence)
+                text = _SECTION_HEADER_RE.sub('', sentence)
                 # Unescape single quotes
                 text = text.replace("''", "'")
                 text = text.strip()
@@ -6,6 +6,7 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from cache import get_cache
 from database import SessionLocal, Translation
 from data.books_metadata import TRANSLATIONS
 
@@ -38,6 +39,7 @@ def fix_translation_names():
 
         if fixes_made > 0:
             db.commit()
+            get_cache().clear_metadata_cache()
             print(f"\nFixed {fixes_made} translation name(s)")
         else:
             print("\nNo fixes needed - all names are correct")
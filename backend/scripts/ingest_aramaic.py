@@ -217,7 +217,7 @@ def run_aramaic_ingestion():
             print("   Loading Strong's Hebrew/Aramaic definitions...")
             orig_lang_mgr.fetch_strongs_data_sync()
 
-        word_count = orig_lang_mgr.populate_hebrew_ot(aramaic_verses, batch_size=100)
+        word_count = orig_lang_mgr.populate_hebrew_ot(aramaic_verses)
 
         # Calculate statistics
         elapsed = time.time() - start_time
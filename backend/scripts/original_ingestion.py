@@ -174,7 +174,7 @@ def run_complete_ingestion():
                 print("\n⚡ Step 5: Populating Greek original words...")
                 print(f"   Processing {len(greek_verses):,} verses...")
 
-                greek_word_count = orig_lang_mgr.populate_greek_nt(greek_verses, batch_size=100)
+                greek_word_count = orig_lang_mgr.populate_greek_nt(greek_verses)
                 print(f"   ✅ Created {greek_word_count:,} Greek words")
 
         # =========================
@@ -244,7 +244,7 @@ def run_complete_ingestion():
                 print("\n⚡ Step 10: Populating Hebrew original words...")
                 print(f"   Processing {len(hebrew_verses):,} verses...")
 
-                hebrew_word_count = orig_lang_mgr.populate_hebrew_ot(hebrew_verses, batch_size=100)
+                hebrew_word_count = orig_lang_mgr.populate_hebrew_ot(hebrew_verses)
                 print(f"   ✅ Created {hebrew_word_count:,} Hebrew words")
 
                 # Populate Aramaic words
@@ -252,7 +252,7 @@ def run_complete_ingestion():
                     print("\n⚡ Step 11: Populating Aramaic original words...")
                     print(f"   Processing {len(aramaic_verses):,} verses...")
 
-                    aramaic_word_count = orig_lang_mgr.populate_hebrew_ot(aramaic_verses, batch_size=100)
+                    aramaic_word_count = orig_lang_mgr.populate_hebrew_ot(aramaic_verses)
                     print(f"   ✅ Created {aramaic_word_count:,} Aramaic words")
 
         # =========================
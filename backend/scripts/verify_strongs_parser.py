@@ -16,10 +16,9 @@ def test_strongs_parser():
     print("TESTING STRONG'S .DAT PARSER")
     print("=" * 70)
 
-    mgr = OriginalLanguageManager()
-
-    print("\n📥 Fetching Strong's data from .dat files...")
-    hebrew_data, greek_data = mgr.fetch_strongs_data_sync()
+    with OriginalLanguageManager() as mgr:
+        print("\n📥 Fetching Strong's data from .dat files...")
+        hebrew_data, greek_data = mgr.fetch_strongs_data_sync()
 
     print(f"\n✅ Successfully loaded:")
     print(f"   Hebrew entries: {len(hebrew_data):,}")
@@ -33,9 +32,9 @@ def test_strongs_parser():
     for strongs_num in test_greek_numbers:
         definition = mgr.get_strongs_definition(strongs_num, "greek")
         if definition:
-            print(f"\n{strongs_num}: {definition.get('lemma', 'N/A')}")
-            print(f"  Transliteration: {definition.get('translit', 'N/A')}")
-            print(f"  Definition: {definition.get('strongs_def', 'N/A')[:80]}...")
+            print(f"\n{strongs_num}: {definition.lemma or 'N/A'}")
+            print(f"  Transliteration: {definition.translit or 'N/A'}")
+            print(f"  Definition: {(definition.definition or 'N/A')[:80]}...")
         else:
             print(f"\n{strongs_num}: ❌ Not found")
 
@@ -47,9 +46,9 @@ def test_strongs_parser():
     for strongs_num in test_hebrew_numbers:
         definition = mgr.get_strongs_definition(strongs_num, "hebrew")
         if definition:
-            print(f"\n{strongs_num}: {definition.get('lemma', 'N/A')}")
-            print(f"  Transliteration: {definition.get('translit', 'N/A')}")
-            print(f"  Definition: {definition.get('strongs_def', 'N/A')[:80]}...")
+            print(f"\n{strongs_num}: {definition.lemma or 'N/A'}")
+            print(f"  Transliteration: {definition.translit or 'N/A'}")
+            print(f"  Definition: {(definition.definition or 'N/A')[:80]}...")
         else:
             print(f"\n{strongs_num}: ❌ Not found")
 
@@ -6,6 +6,7 @@ Enhanced with hybrid search (vector + full-text), RRF fusion, and
 query expansion support for improved retrieval quality.
 """
 
+import asyncio
 import logging
 import time
 from typing import Optional
@@ -804,7 +805,8 @@ async def search_verses(
     all_row_data: dict[str, dict] = {}
 
     # 1. Vector search on original query
-    query_embedding = embed_query(query, api_key=api_key)
+    # Encoding (local model or Gemini call) blocks, so keep it off the event loop
+    query_embedding = await asyncio.to_thread(embed_query, query, api_key=api_key)
     vector_results = await _vector_search(
         db, query_embedding, translation_ids, filters,
         settings.similarity_threshold, internal_limit,
@@ -829,7 +831,7 @@ async def search_verses(
     if expanded_queries:
         for eq in expanded_queries:
             try:
-                eq_embedding = embed_query(eq, api_key=api_key)
+                eq_embedding = await asyncio.to_thread(embed_query, eq, api_key=api_key)
                 eq_results = await _vector_search(
                     db, eq_embedding, translation_ids, filters,
                     settings.similarity_threshold, internal_limit,
@@ -855,7 +857,7 @@ async def search_verses(
 
     # 4b. Cross-encoder reranking
     if settings.enable_reranking and merged:
-        from reranker import rerank
+        from reranker_batcher import rerank_async
 
         rerank_count = min(len(merged), settings.rerank_top_n)
         candidates = []
@@ -870,9 +872,11 @@ async def search_verses(
 
         if candidates:
             try:
-                reranked = rerank(query, candidates, top_k=max_results)
-                top_refs = [(c["ref_key"], c["rerank_score"]) for c in reranked]
-                search_method += "+rerank"
+                reranked = await rerank_async(query, candidates, top_k=max_results)
+                # Candidates that all fit in max_results come back unscored in RRF order
+                top_refs = [(c["ref_key"], c.get("rerank_score", c["rrf_score"])) for c in reranked]
+                if "rerank_score" in reranked[0]:
+                    search_method += "+rerank"
             except Exception as e:
                 logger.warning(f"Reranking failed, falling back to RRF order: {e}")
                 top_refs = merged[:max_results]
@@ -212,6 +212,9 @@ async def test_client(test_db: AsyncSession, mock_redis) -> AsyncGenerator:
     test_app.include_router(verses.router) # /api/verse /api/chapter
     test_app.include_router(themes.router) # /api/themes
     test_app.include_router(health.router) # /health
+
+    # Book listings are memoized in-process; start each test from an empty copy
+    metadata._books_bodies.clear()
     
     # Patch get_cache in checking locations
     patch_health_cache = patch("routers.health.get_cache", return_value=mock_redis)
@@ -448,6 +451,7 @@ def mock_redis():
     mock.get_cache_stats.return_value = {"cached_searches": 0}
     mock.get_cached_verse.return_value = None
     mock.get_cached_results.return_value = None
+    mock.get_cached_metadata.return_value = None
     
     # Mock client methods (if accessed directly)
     mock.get.return_value = None
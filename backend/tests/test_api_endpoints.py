@@ -28,6 +28,29 @@ async def test_health_endpoint(test_client):
     assert "timestamp" in data
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_health_stats_cached(test_client, mock_redis):
+    """Test health stats are served from the cache when present."""
+    mock_redis.get_cached_metadata.return_value = '{"total_verses": 42}'
+
+    response = await test_client.get("/health")
+    assert response.status_code == 200
+    assert response.json()["stats"]["total_verses"] == 42
+    mock_redis.get_cached_metadata.assert_called_with("health:stats")
+    mock_redis.cache_metadata.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_liveness_endpoint(test_client, mock_redis):
+    """Test the liveness probe answers without checking services."""
+    response = await test_client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    mock_redis.is_connected.assert_not_called()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_get_translations_empty(test_client):
@@ -57,6 +80,22 @@ async def test_get_translations_with_data(test_client, sample_translation):
     assert data["translations"][0]["name"] == "Test English Version"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_translations_cached(test_client, mock_redis, sample_translation):
+    """Test translation listings are cached and served from the cache."""
+    response = await test_client.get("/api/translations?language=en")
+    assert response.status_code == 200
+    key, body = mock_redis.cache_metadata.call_args.args
+    assert key == "translations:en"
+
+    # A cache hit is returned as-is without rebuilding the listing
+    mock_redis.get_cached_metadata.return_value = body
+    cached = await test_client.get("/api/translations?language=en")
+    assert cached.json() == response.json()
+    mock_redis.cache_metadata.assert_called_once()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_get_books_empty(test_client):
@@ -83,6 +122,18 @@ async def test_get_books_with_data(test_client, sample_book):
     assert data["books"][0]["testament"] == "OT"
 
 
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_get_books_memoized_in_process(test_client, mock_redis, sample_book):
+    """Test repeated book listings are served from memory without Redis."""
+    response = await test_client.get("/api/books")
+    repeated = await test_client.get("/api/books")
+
+    assert repeated.json() == response.json()
+    mock_redis.get_cached_metadata.assert_called_once_with("books::")
+    mock_redis.cache_metadata.assert_called_once()
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 async def test_get_books_filter_testament(test_client, sample_book, sample_nt_book):
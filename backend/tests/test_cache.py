@@ -155,3 +155,35 @@ def test_get_cache_stats(mock_redis):
     assert stats["connected"] is True
     assert stats["used_memory"] == "1.5M"
     assert stats["cached_searches"] == 2
+
+
+@pytest.mark.unit
+def test_generate_response_cache_key():
+    """Test response cache keys normalize the query and verse order."""
+    cache = CacheClient()
+
+    verses = [
+        {"reference": {"book": "John", "chapter": 3, "verse": 16}},
+        {"reference": {"book": "Romans", "chapter": 5, "verse": 8}},
+    ]
+
+    key1 = cache.generate_response_cache_key("What is love?", verses, "en")
+    key2 = cache.generate_response_cache_key("  what is   LOVE ", verses[::-1], "en")
+    assert key1 == key2, "Response keys should ignore case, punctuation and verse order"
+
+    key3 = cache.generate_response_cache_key("What is love?", verses, "ko")
+    assert key1 != key3, "Different languages should produce different keys"
+
+
+@pytest.mark.unit
+def test_cache_response(mock_redis):
+    """Test caching and retrieving an AI response."""
+    cache = CacheClient()
+    cache._client = mock_redis
+
+    assert cache.cache_response("test_key", "God is love.") is True
+    mock_redis.setex.assert_called_once()
+
+    mock_redis.get.return_value = "God is love."
+    assert cache.get_cached_response("test_key") == "God is love."
+    mock_redis.get.assert_called_with("response:test_key")
@@ -1,5 +1,7 @@
 """Tests for LLM functionality."""
 
+import uuid
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -169,6 +171,35 @@ def test_generate_contextual_response_error_handling(mock_gemini):
     assert response is None or isinstance(response, str)
 
 
+@pytest.mark.unit
+def test_gemini_model_binds_user_key_without_caching():
+    """Test user-key Gemini models get their own clients and are not cached."""
+    from types import SimpleNamespace
+    from llm import _get_gemini_model
+
+    with patch("llm.genai") as mock_genai, patch("llm.glm") as mock_glm:
+        mock_genai.GenerativeModel.side_effect = lambda *args, **kwargs: SimpleNamespace(
+            _client=None, _async_client=None
+        )
+
+        first = _get_gemini_model("user-key")
+        second = _get_gemini_model("user-key")
+
+    assert first is not second
+    assert first._client is mock_glm.GenerativeServiceClient.return_value
+    assert first._async_client is mock_glm.GenerativeServiceAsyncClient.return_value
+    mock_glm.GenerativeServiceClient.assert_called_with(client_options={"api_key": "user-key"})
+
+
+@pytest.mark.unit
+def test_bind_gemini_clients_fails_without_client_attributes():
+    """Test binding refuses SDK models that no longer expose their clients."""
+    from llm import _bind_gemini_clients
+
+    with patch("llm.glm"), pytest.raises(RuntimeError):
+        _bind_gemini_clients(object(), "user-key")
+
+
 @pytest.mark.unit
 def test_generate_contextual_response_empty_verses():
     """Test generating response with no verses."""
@@ -181,7 +212,7 @@ def test_generate_contextual_response_empty_verses():
 
 
 @pytest.mark.unit
-@patch("llm.generate_contextual_response")
+@patch("llm_batcher.generate_contextual_response")
 def test_batched_generate_response(mock_generate):
     """Test batched response generation."""
     import asyncio
@@ -241,3 +272,191 @@ def test_prompt_length_limits():
 
     # Prompt should be reasonable length (not exceed 100k chars)
     assert len(prompt) < 100000
+
+
+@pytest.mark.unit
+def test_build_prompt_truncates_long_verses():
+    """Test that long verse text is truncated to 150 characters."""
+    from llm import _build_prompt
+
+    verses = [
+        {
+            "reference": {"book": "Psalms", "chapter": 119, "verse": 1},
+            "translations": {"NIV": "a" * 150},
+        },
+        {
+            "reference": {"book": "Psalms", "chapter": 119, "verse": 2},
+            "translations": {"NIV": "b" * 151},
+        },
+    ]
+
+    prompt = _build_prompt("test query", verses, "en")
+
+    assert f'"{"a" * 150}"' in prompt
+    assert f'"{"b" * 150}..."' in prompt
+
+
+@pytest.mark.unit
+async def test_batcher_coalesces_identical_inflight_requests():
+    """Test concurrent identical requests share a single LLM call."""
+    import asyncio
+    from llm_batcher import LLMBatcher, settings as batcher_settings
+
+    batcher = LLMBatcher()
+    calls = 0
+
+    async def fake_enqueue(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "Shared response"
+
+    verses = [
+        {
+            "reference": {"book": "John", "chapter": 3, "verse": 16},
+            "translations": {"NIV": "For God so loved the world..."},
+        }
+    ]
+
+    with patch.object(batcher_settings, "enable_batching", True), patch(
+        "llm_batcher.get_cache"
+    ) as mock_get_cache, patch.object(batcher, "_enqueue_and_wait", side_effect=fake_enqueue):
+        mock_get_cache.return_value.get_cached_response.return_value = None
+        mock_get_cache.return_value.generate_response_cache_key.return_value = "key"
+
+        results = await asyncio.gather(
+            *(batcher.submit_request("What is love?", verses, "en") for _ in range(3))
+        )
+
+    assert results == ["Shared response"] * 3
+    assert calls == 1
+    assert batcher._inflight == {}
+
+
+@pytest.mark.unit
+async def test_batcher_cancelled_leader_releases_coalesced_requests():
+    """Test duplicates still finish when the request they wait on is cancelled."""
+    import asyncio
+    from llm_batcher import LLMBatcher, settings as batcher_settings
+
+    batcher = LLMBatcher()
+    calls = 0
+
+    async def fake_enqueue(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return "Own response"
+
+    with patch.object(batcher_settings, "enable_batching", True), patch(
+        "llm_batcher.get_cache"
+    ) as mock_get_cache, patch.object(batcher, "_enqueue_and_wait", side_effect=fake_enqueue):
+        mock_get_cache.return_value.get_cached_response.return_value = None
+        mock_get_cache.return_value.generate_response_cache_key.return_value = "key"
+
+        leader = asyncio.create_task(batcher.submit_request("What is love?", [], "en"))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(batcher.submit_request("What is love?", [], "en"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.wait_for(asyncio.gather(*followers), timeout=1)
+
+    assert leader.cancelled()
+    assert results == ["Own response"] * 2
+    assert batcher._inflight == {}
+
+
+@pytest.mark.unit
+async def test_batcher_does_not_coalesce_user_key_requests():
+    """Test requests carrying their own API key each make their own call."""
+    import asyncio
+    from llm_batcher import LLMBatcher, settings as batcher_settings
+
+    batcher = LLMBatcher()
+    keys = []
+
+    async def fake_enqueue(*args, gemini_api_key=None, groq_api_key=None):
+        keys.append(groq_api_key)
+        await asyncio.sleep(0.01)
+        return "Response"
+
+    with patch.object(batcher_settings, "enable_batching", True), patch(
+        "llm_batcher.get_cache"
+    ) as mock_get_cache, patch.object(batcher, "_enqueue_and_wait", side_effect=fake_enqueue):
+        mock_get_cache.return_value.get_cached_response.return_value = None
+        mock_get_cache.return_value.generate_response_cache_key.return_value = "key"
+
+        await asyncio.gather(
+            batcher.submit_request("What is love?", [], "en"),
+            batcher.submit_request("What is love?", [], "en", groq_api_key="user-a"),
+            batcher.submit_request("What is love?", [], "en", groq_api_key="user-b"),
+        )
+
+    assert sorted(keys, key=str) == sorted([None, "user-a", "user-b"], key=str)
+    assert batcher._inflight == {}
+
+
+@pytest.mark.unit
+def test_build_marshaled_prompt():
+    """Test multiple requests are numbered within one prompt."""
+    import time
+    from llm_batcher import BatchRequest, _build_marshaled_prompt
+
+    batch = [
+        BatchRequest(
+            id=uuid.uuid4(),
+            query=query,
+            verses=[
+                {
+                    "reference": {"book": "John", "chapter": 3, "verse": 16},
+                    "translations": {"NIV": "For God so loved the world..."},
+                }
+            ],
+            language="en",
+            timestamp=time.time(),
+            completed=MagicMock(),
+        )
+        for query in ("What is love?", "What is grace?")
+    ]
+
+    prompt = _build_marshaled_prompt(batch)
+
+    assert "### Question 1" in prompt
+    assert "### Question 2" in prompt
+    assert prompt.index("What is love?") < prompt.index("What is grace?")
+    assert '"answer"' in prompt
+
+
+@pytest.mark.unit
+async def test_race_streams_keeps_first_provider_to_stream():
+    """Test racing keeps the fastest successful stream and closes the rest."""
+    import asyncio
+    from llm import _race_streams
+
+    closed = []
+
+    async def provider(name, delay, chunks):
+        try:
+            for chunk in chunks:
+                await asyncio.sleep(delay)
+                yield chunk
+        finally:
+            closed.append(name)
+
+    # A provider failing fast (None) loses to a slower one that succeeds
+    result = [
+        chunk
+        async for chunk in _race_streams([
+            provider("failing", 0.001, [None]),
+            provider("slow", 0.05, ["slow"]),
+            provider("fast", 0.01, ["fast 1", "fast 2"]),
+        ])
+    ]
+
+    assert result == ["fast 1", "fast 2"]
+    assert sorted(closed) == ["failing", "fast", "slow"]
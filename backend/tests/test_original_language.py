@@ -0,0 +1,285 @@
+"""Tests for original language (Strong's) data handling."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+import requests
+
+from original_language import (
+    OriginalLanguageManager,
+    StrongsEntry,
+    _compact_strongs,
+    _lookup_strongs,
+    _read_strongs_cache,
+    _write_strongs_cache,
+)
+
+
+JS_DICTIONARY = (
+    'var strongsGreekDictionary = {"G25": {"lemma": "ἀγαπάω", "translit": "agapáō", '
+    '"strongs_def": " to love"}};\nmodule.exports = strongsGreekDictionary;'
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_strongs_lookup_cache():
+    """Reset memoized Strong's lookups, since tests patch the shared data directly."""
+    _lookup_strongs.cache_clear()
+    yield
+    _lookup_strongs.cache_clear()
+
+
+@pytest.mark.unit
+def test_parse_js_dictionary_accepts_text_and_bytes():
+    """Test the JS dictionary parser handles decoded text and raw response bytes."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+
+    from_text = mgr._parse_js_dictionary(JS_DICTIONARY)
+    from_bytes = mgr._parse_js_dictionary(JS_DICTIONARY.encode("utf-8"))
+
+    assert from_text == from_bytes
+    assert from_bytes["G25"]["lemma"] == "ἀγαπάω"
+
+
+@pytest.mark.unit
+def test_parse_js_dictionary_invalid_input():
+    """Test malformed input yields an empty dictionary."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+
+    assert mgr._parse_js_dictionary(b"not a dictionary") == {}
+    assert mgr._parse_js_dictionary(b'var x = {"G1": };') == {}
+
+
+@pytest.mark.unit
+def test_strongs_disk_cache_roundtrip(tmp_path):
+    """Test parsed Strong's data is cached on disk together with its ETag."""
+    url = "https://example.com/strongsgreek.dat"
+    data = {"G25": StrongsEntry("ἀγαπάω", "agapáō", "to love")}
+
+    with patch("original_language.get_settings", return_value=SimpleNamespace(strongs_cache_dir=str(tmp_path))):
+        assert _read_strongs_cache(url) == (None, None, 0.0)
+
+        # Responses without an ETag cannot be revalidated, so they are not cached
+        _write_strongs_cache(url, None, data)
+        assert _read_strongs_cache(url) == (None, None, 0.0)
+
+        _write_strongs_cache(url, '"abc123"', data)
+        cached, etag, fetched_at = _read_strongs_cache(url)
+        assert (cached, etag) == (data, '"abc123"')
+        assert fetched_at > 0
+
+
+@pytest.mark.unit
+def test_fresh_strongs_cache_skips_request(tmp_path):
+    """Test a recently fetched source is served from disk without a request."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+    url = "https://example.com/strongsgreek.dat"
+    data = {"G25": StrongsEntry("ἀγαπάω", "agapáō", "to love")}
+    settings = SimpleNamespace(strongs_cache_dir=str(tmp_path), strongs_cache_max_age=3600)
+    session = MagicMock(spec=requests.Session)
+
+    with patch("original_language.get_settings", return_value=settings):
+        _write_strongs_cache(url, '"abc123"', data)
+        assert mgr._get_cached_sync(session, url, lambda lines: {}) == data
+
+    session.get.assert_not_called()
+
+
+@pytest.mark.unit
+def test_strongs_data_shared_across_managers():
+    """Test Strong's data loaded by one manager is visible to every other manager."""
+    with patch.dict("original_language._STRONGS", {}, clear=True):
+        first = OriginalLanguageManager(db=MagicMock())
+        second = OriginalLanguageManager(db=MagicMock())
+        assert second.get_strongs_definition("G25", "greek") is None
+
+        first.strongs_greek_data = {"G25": StrongsEntry("ἀγαπάω", "agapáō", "to love")}
+
+        assert second.strongs_greek_data is first.strongs_greek_data
+        assert second.get_strongs_definition("G25", "greek").definition == "to love"
+
+
+@pytest.mark.unit
+def test_get_strongs_definition_language_dispatch():
+    """Test Aramaic resolves against Hebrew Strong's and unknown languages are rejected."""
+    entry = StrongsEntry("אֱלָהּ", "ʼělâhh", "God")
+    with patch.dict("original_language._STRONGS", {"hebrew": {"H426": entry}}, clear=True):
+        mgr = OriginalLanguageManager(db=MagicMock())
+
+        assert mgr.get_strongs_definition("H426", "aramaic") == entry
+        assert mgr.get_strongs_definition("H426", "hebrew") == entry
+
+        with pytest.raises(ValueError):
+            mgr.get_strongs_definition("L1", "latin")
+
+
+@pytest.mark.unit
+def test_compact_strongs_keeps_enrichment_fields():
+    """Test upstream entries are reduced to lemma, transliteration and definition."""
+    raw = {
+        "G25": {"lemma": "ἀγαπάω", "translit": "agapáō", "strongs_def": "to love", "kjv_def": "love", "derivation": "..."},
+        "G26": {"lemma": "ἀγάπη", "translit": "agápē", "kjv_def": "love"},
+    }
+
+    compact = _compact_strongs(raw)
+
+    assert compact["G25"] == StrongsEntry("ἀγαπάω", "agapáō", "to love")
+    # kjv_def is the fallback when strongs_def is missing
+    assert compact["G26"].definition == "love"
+
+
+@pytest.mark.unit
+def test_parse_strongs_from_text_word_boundaries():
+    """Test Strong's numbers are only matched as whole words."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+
+    text = "G25, (H430) xG1 _H2 αG3 G123456 G12a 1G1 G7"
+
+    assert mgr.parse_strongs_from_text(text) == ["G25", "H430", "G7"]
+    assert list(mgr.iter_strongs_from_text(text)) == ["G25", "H430", "G7"]
+
+
+@pytest.mark.unit
+def test_parse_strongs_from_texts_matches_single_text_parser():
+    """Test bulk Strong's parsing agrees with the per-text parser."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+    texts = ["love G25 God H430", "no numbers here", "G2316 G12345678 αG1 H7225"]
+
+    expected = [mgr.parse_strongs_from_text(text) for text in texts]
+
+    assert mgr.parse_strongs_from_texts(texts) == expected
+    with patch("original_language.HYPERSCAN_AVAILABLE", False):
+        assert mgr.parse_strongs_from_texts(texts) == expected
+
+
+@pytest.mark.unit
+def test_resolve_many_looks_up_each_pair_once():
+    """Test batch resolution dedupes pairs and omits unknown numbers."""
+    entry = StrongsEntry("θεός", "theós", "a deity")
+    with patch.dict("original_language._STRONGS", {"greek": {"G2316": entry}}, clear=True):
+        mgr = OriginalLanguageManager(db=MagicMock())
+
+        with patch.object(mgr, "get_strongs_definition", wraps=mgr.get_strongs_definition) as lookup:
+            resolved = mgr._resolve_many([("G2316", "greek"), ("G2316", "greek"), ("G9999", "greek")])
+
+        assert resolved == {("G2316", "greek"): entry}
+        assert lookup.call_count == 2
+
+
+@pytest.mark.unit
+def test_add_sample_original_words_inserts_in_one_statement():
+    """Test sample words are resolved up front and written with a single bulk insert."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+    john_id, genesis_id = uuid4(), uuid4()
+    entry = StrongsEntry("ἀγαπάω", "agapáō", "to love")
+
+    with patch.object(
+        mgr, "_resolve_verse_ids", return_value={("John", 3, 16): john_id, ("Genesis", 1, 1): genesis_id}
+    ), patch.object(
+        mgr, "_resolve_many", return_value={("G25", "greek"): entry}
+    ), patch.object(
+        mgr, "_insert_original_words", side_effect=lambda rows: [uuid4() for _ in rows]
+    ) as insert_words:
+        created = mgr.add_sample_original_words()
+
+    insert_words.assert_called_once()
+    rows = insert_words.call_args.args[0]
+    assert created == len(rows) == 14
+    assert {row["verse_id"] for row in rows} == {john_id, genesis_id}
+    assert next(row for row in rows if row["strongs_number"] == "G25")["definition"] == "to love"
+    mgr.db.commit.assert_called_once()
+
+
+@pytest.mark.unit
+def test_postgres_original_words_use_copy():
+    """Test PostgreSQL batches are streamed with COPY in text format."""
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    mgr = OriginalLanguageManager(db=db)
+    verse_id = uuid4()
+    row = {
+        "verse_id": verse_id,
+        "word": "λόγος",
+        "language": "greek",
+        "strongs_number": "G3056",
+        "transliteration": None,
+        "morphology": "N-NSM",
+        "definition": "a word\tsaid\\spoken",
+        "word_order": 2,
+    }
+
+    copied = []
+    cursor = db.connection.return_value.connection.cursor.return_value
+    cursor.copy_expert.side_effect = lambda sql, buffer: copied.append((sql, buffer.read()))
+
+    mgr._write_original_words()([row])
+
+    sql, data = copied[0]
+    assert sql.startswith("COPY original_words (id, verse_id, word,")
+    fields = data.rstrip("\n").split("\t")
+    assert fields[1:8] == [
+        str(verse_id), "λόγος", "greek", "G3056", "\\N", "N-NSM", "a word\\tsaid\\\\spoken"
+    ]
+    assert fields[8] == "2"
+    db.execute.assert_not_called()
+
+
+@pytest.mark.unit
+def test_parse_dat_format():
+    """Test parsing Strong's .dat entries into prefixed numbers."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+    dat_text = (
+        "$$T0005598\n\\05598\\\n 5598  omega  o'-meg-ah\n\n"
+        " the last letter of the Greek alphabet, i.e. (figuratively) the\n"
+        " finality:--Omega.\n"
+        "$$T0000025\n\\00025\\\n 25  agapao  ag-ap-ah'-o\n\n to love\n"
+    )
+
+    parsed = mgr._parse_dat_format(dat_text, "greek")
+
+    assert set(parsed) == {"G5598", "G25"}
+    assert parsed["G25"]["lemma"] == "agapao"
+    assert parsed["G25"]["translit"] == "ag-ap-ah'-o"
+    assert parsed["G5598"]["strongs_def"].endswith("finality:--Omega.")
+
+    # Streamed lines parse the same as the whole text
+    assert mgr._parse_dat_format(iter(dat_text.splitlines(keepends=True)), "greek") == parsed
+
+
+@pytest.mark.unit
+def test_get_cached_sync_streams_lines_into_parser(tmp_path):
+    """Test synchronous fetches hand the parser response lines, not the whole body."""
+    mgr = OriginalLanguageManager(db=MagicMock())
+    lines = ["$$T0000025", "\\00025\\", " 25  agapao  ag-ap-ah'-o", "", " to love"]
+
+    response = MagicMock(spec=requests.Response, status_code=200, headers={})
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = iter(lines)
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value = response
+
+    with patch("original_language.get_settings", return_value=SimpleNamespace(strongs_cache_dir=str(tmp_path))):
+        data = mgr._get_cached_sync(
+            session, "https://example.com/strongsgreek.dat",
+            lambda body: mgr._parse_dat_format(body, "greek"),
+        )
+
+    assert data == _compact_strongs(mgr._parse_dat_format("\n".join(lines), "greek"))
+    assert data["G25"].lemma == "agapao"
+    assert session.get.call_args.kwargs["stream"] is True
+    response.iter_lines.assert_called_once_with(decode_unicode=True)
+
+
+@pytest.mark.unit
+def test_strongs_lookup_cache_cleared_on_reload():
+    """Test memoized lookups do not outlive replaced Strong's data."""
+    with patch.dict("original_language._STRONGS", {}, clear=True):
+        mgr = OriginalLanguageManager(db=MagicMock())
+
+        mgr.strongs_greek_data = {"G25": StrongsEntry("ἀγαπάω", "agapáō", "to love")}
+        assert mgr.get_strongs_definition("G25", "greek").definition == "to love"
+
+        mgr.strongs_greek_data = {"G25": StrongsEntry("ἀγαπάω", "agapáō", "to love, cherish")}
+        assert mgr.get_strongs_definition("G25", "greek").definition == "to love, cherish"
@@ -0,0 +1,70 @@
+"""Tests for LLM rate limiting."""
+
+import pytest
+from unittest.mock import patch
+
+
+@pytest.mark.unit
+def test_check_local_rate_limit_token_bucket():
+    """Test the token bucket allows `limit` calls then refills over time."""
+    import rate_limit
+
+    with patch.dict(rate_limit._rate_limit_state, {"test": {"tokens": None, "last_refill": 0.0}}):
+        with patch("rate_limit.time.monotonic", return_value=1000.0):
+            assert all(rate_limit.check_local_rate_limit("test", 3) for _ in range(3))
+            assert rate_limit.check_local_rate_limit("test", 3) is False
+
+        # 3 RPM refills one token every 20 seconds
+        with patch("rate_limit.time.monotonic", return_value=1020.0):
+            assert rate_limit.check_local_rate_limit("test", 3) is True
+            assert rate_limit.check_local_rate_limit("test", 3) is False
+
+
+@pytest.mark.unit
+def test_sliding_window_limiter_weights_previous_window(mock_redis):
+    """Test the Redis sliding window counts part of the previous window."""
+    from rate_limit import SlidingWindowLimiter
+
+    pipe = mock_redis.pipeline.return_value
+    limiter = SlidingWindowLimiter(window_seconds=60)
+
+    # Halfway through the window: 10 * 0.5 + 4 earlier requests = 9 < 10
+    pipe.execute.return_value = [5, True, "10"]
+    with patch("rate_limit.get_cache") as mock_get_cache, patch("rate_limit.time.time", return_value=6030.0):
+        mock_get_cache.return_value.client = mock_redis
+        assert limiter.allow("groq", 10) is True
+
+        # 10 * 0.5 + 5 earlier requests = 10 >= 10
+        pipe.execute.return_value = [6, True, "10"]
+        assert limiter.allow("groq", 10) is False
+        mock_redis.decr.assert_called_once()
+
+
+@pytest.mark.unit
+def test_sliding_window_limiter_falls_back_without_redis():
+    """Test the limiter uses the in-process bucket when Redis is down."""
+    import redis
+    from rate_limit import SlidingWindowLimiter
+
+    limiter = SlidingWindowLimiter()
+    with patch("rate_limit.get_cache") as mock_get_cache, patch(
+        "rate_limit.check_local_rate_limit", return_value=True
+    ) as mock_local:
+        mock_get_cache.return_value.client.pipeline.side_effect = redis.ConnectionError()
+        assert limiter.allow("gemini", 10) is True
+        mock_local.assert_called_once_with("gemini", 10)
+
+
+@pytest.mark.unit
+def test_check_local_rate_limit_is_thread_safe():
+    """Test concurrent callers never exceed the token bucket capacity."""
+    from concurrent.futures import ThreadPoolExecutor
+    import rate_limit
+
+    with patch.dict(rate_limit._rate_limit_state, {"test": {"tokens": None, "last_refill": 0.0}}):
+        # Freeze time so no tokens are refilled during the test
+        with patch("rate_limit.time.monotonic", return_value=1000.0):
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                results = list(pool.map(lambda _: rate_limit.check_local_rate_limit("test", 50), range(500)))
+
+    assert sum(results) == 50
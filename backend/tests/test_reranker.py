@@ -0,0 +1,129 @@
+"""Tests for cross-encoder reranking."""
+
+from unittest.mock import MagicMock, patch
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from reranker import apply_scores, rerank
+from reranker_batcher import RerankBatcher
+
+
+@pytest.mark.unit
+def test_rerank_scores_length_sorted_and_maps_back():
+    """Test passages are scored shortest first and scores land on the right candidate."""
+    candidates = [
+        {"id": "long", "text": "x" * 30},
+        {"id": "short", "text": "x"},
+        {"id": "mid", "text": "x" * 10},
+    ]
+    model = MagicMock()
+    # Score each pair by its passage length, so the longest passage ranks first
+    model.predict.side_effect = lambda pairs, **kwargs: [float(len(text)) for _, text in pairs]
+
+    with patch("reranker._get_reranker", return_value=model):
+        results = rerank("query", candidates, top_k=2)
+
+    pairs = model.predict.call_args.args[0]
+    assert [len(text) for _, text in pairs] == [1, 10, 30]
+    assert [r["id"] for r in results] == ["long", "mid"]
+    assert results[0]["rerank_score"] == 30.0
+
+
+@pytest.mark.unit
+def test_rerank_truncates_passages():
+    """Test passages are capped before tokenization."""
+    model = MagicMock()
+    model.predict.return_value = [0.5]
+
+    with patch("reranker._get_reranker", return_value=model), \
+            patch("reranker.settings.reranker_char_cap", 5), \
+            patch("reranker.settings.reranker_always_score", True):
+        rerank("query", [{"text": "abcdefghij"}], top_k=1)
+
+    assert model.predict.call_args.args[0] == [("query", "abcde")]
+
+
+@pytest.mark.unit
+def test_rerank_empty_candidates():
+    """Test reranking nothing returns without loading the model."""
+    with patch("reranker._get_reranker") as get_reranker:
+        assert rerank("query", [], top_k=5) == []
+    get_reranker.assert_not_called()
+
+
+@pytest.mark.unit
+def test_rerank_skips_model_when_candidates_fit_top_k():
+    """Test candidates that all fit in top_k are returned unscored in their order."""
+    candidates = [{"text": "b"}, {"text": "a"}]
+
+    with patch("reranker._get_reranker") as get_reranker, \
+            patch("reranker.settings.reranker_always_score", False):
+        assert rerank("query", candidates, top_k=2) == candidates
+    get_reranker.assert_not_called()
+
+
+@pytest.mark.unit
+def test_load_cross_encoder_moves_complete_export_into_place(tmp_path):
+    """Test the ONNX export is written elsewhere and renamed into the export dir."""
+    import sys
+    from reranker import _load_cross_encoder
+
+    saved_to = []
+
+    def save_pretrained(path):
+        saved_to.append(path)
+        (Path(path) / "model.onnx").write_text("onnx")
+
+    model = MagicMock()
+    model.save_pretrained.side_effect = save_pretrained
+    st = MagicMock()
+    st.CrossEncoder.side_effect = [Exception("no quantized weights"), model]
+
+    with patch.dict(sys.modules, {"sentence_transformers": st}), \
+            patch("reranker.settings.reranker_backend", "onnx"), \
+            patch("reranker.settings.reranker_model", "org/model"), \
+            patch("reranker.settings.reranker_export_dir", str(tmp_path)):
+        assert _load_cross_encoder() is model
+
+    export_dir = tmp_path / "org--model-onnx"
+    assert saved_to and Path(saved_to[0]) != export_dir
+    assert (export_dir / "model.onnx").read_text() == "onnx"
+    assert [p.name for p in tmp_path.iterdir()] == ["org--model-onnx"]
+
+
+@pytest.mark.unit
+def test_apply_scores_selects_top_k_keeping_tie_order():
+    """Test top-k selection orders by score and keeps input order among ties."""
+    candidates = [{"id": i} for i in range(5)]
+
+    results = apply_scores(candidates, [1.0, 3.0, 1.0, 3.0, 2.0], top_k=3)
+
+    assert [r["id"] for r in results] == [1, 3, 4]
+    assert [r["rerank_score"] for r in results] == [3.0, 3.0, 2.0]
+    assert "rerank_score" not in candidates[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+async def test_rerank_batcher_coalesces_concurrent_searches():
+    """Test concurrent searches share one model call and get their own results back."""
+    model = MagicMock()
+    model.predict.side_effect = lambda pairs, **kwargs: [float(len(text)) for _, text in pairs]
+    batcher = RerankBatcher()
+
+    with patch("reranker._get_reranker", return_value=model):
+        await batcher.start()
+        try:
+            first, second = await asyncio.gather(
+                batcher.submit("a", [{"text": "xx"}, {"text": "x"}], top_k=1),
+                batcher.submit("b", [{"text": "y"}, {"text": "yyy"}, {"text": "yy"}], top_k=2),
+            )
+        finally:
+            await batcher.stop()
+
+    model.predict.assert_called_once()
+    assert [c["text"] for c in first] == ["xx"]
+    assert [c["text"] for c in second] == ["yyy", "yy"]